@@ -5,9 +5,15 @@ from pyglet import clock
 
 from .scene import BaseScene  # noqa
 from .animation import Sequence, KeyFrame, Chain  # noqa
+from .profiler import FrameProfiler
+from .graph import SceneGraph  # noqa
+from .chunks import ChunkedSpriteList  # noqa
+from .layout import Row, Column, Grid, EdgeLayout  # noqa
 from .helpers import (  # noqa
     PositionHelperMixin, Sprite, ObservableSprite, AnchorPoint, Widget,
+    Viewport, WidgetBatch, TriggerAttr, before_change, after_change, trigger,
 )
+from .widgets import VirtualList, TextSprite  # noqa
 
 
 def bind(fn, window_fn):
@@ -31,12 +37,17 @@ class Curtains:
         self.window = None
         self.scenes = {}
         self.options = Options(kwargs)
+        self.time_scale = 1
+        self.profiler = None
         if window:
             self.bind(window)
 
     def add_scene(self, name, scene):
         self.scenes[name] = scene
         scene._bind(self.window, self)
+        # keep a profiler the scene enabled on itself
+        if self.profiler is not None:
+            scene.events.set_profiler(self.profiler)
 
     def add_scenes(self, scenes):
         for name, scene in scenes.items():
@@ -49,6 +60,30 @@ class Curtains:
         self.current_scene = self.scenes[name]
         self.current_scene.enter_scene(previous_scene)
 
+    def enable_profiling(self, window=120, overlay=False, budget=None):
+        self.profiler = FrameProfiler(
+            window=window, overlay=overlay, budget=budget)
+        for scene in self.scenes.values():
+            scene.events.set_profiler(self.profiler)
+        return self.profiler
+
+    def disable_profiling(self):
+        for scene in self.scenes.values():
+            if scene.events.profiler is self.profiler:
+                scene.events.set_profiler(None)
+        self.profiler = None
+
+    def _end_frame(self):
+        """
+        End the frame of the profiler of Curtains, and of the current scene
+        when it profiles itself.
+        """
+        scene_profiler = self.current_scene.events.profiler
+        if scene_profiler is not None and scene_profiler is not self.profiler:
+            scene_profiler.end_frame()
+        if self.profiler:
+            self.profiler.end_frame()
+
     def bind(self, window=None):
         if window:
             self.window = window
@@ -76,32 +111,163 @@ class Curtains:
         # clock.schedule(window.update)
         clock.schedule_interval(window.update, 1 / 60)
 
-    def on_draw(self):
-        arcade.start_render()
+    def _profiled(self, phase, fn, *args):
+        if self.profiler is None:
+            return fn(*args)
+        with self.profiler.phase(phase):
+            return fn(*args)
 
+    def _draw(self):
         self.current_scene.events.trigger_before_draw()
         self.current_scene.draw()
         self.current_scene.events.trigger_after_draw()
 
+    def on_draw(self):
+        arcade.start_render()
+
+        self._profiled("draw", self._draw)
+        self._end_frame()
+        if self.profiler:
+            if self.profiler.overlay:
+                self.profiler.draw_overlay(10, self.window.height - 20)
+
     def update(self, delta_time):
-        self.current_scene.events.trigger_frame(delta_time)
+        self._profiled("update", self.current_scene._update,
+                       delta_time * self.time_scale)
 
     def on_mouse_motion(self, x, y, dx, dy):
-        self.current_scene.events.update(x, y)
+        self._profiled("events", self.current_scene.events.update, x, y)
 
     def on_mouse_press(self, x, y, button, modifiers):
         if button == arcade.MOUSE_BUTTON_LEFT:
-            self.current_scene.events.trigger_down(x, y)
+            self._profiled("events", self.current_scene.events.trigger_down,
+                           x, y)
 
     def on_mouse_release(self, x, y, button, modifiers):
         if button == arcade.MOUSE_BUTTON_LEFT:
-            self.current_scene.events.trigger_up(x, y)
+            self._profiled("events", self.current_scene.events.trigger_up, x,
+                           y)
 
     def on_mouse_drag(self, x, y, dx, dy, buttons, modifiers):
-        self.current_scene.events.trigger_drag(x, y, dx, dy)
+        self._profiled("events", self.current_scene.events.trigger_drag, x, y,
+                       dx, dy)
 
     def on_key_press(self, key, modifiers):
-        self.current_scene.events.trigger_key_press(key)
+        self._profiled("events", self.current_scene.events.trigger_key_press,
+                       key)
 
     def on_key_release(self, key, modifiers):
-        self.current_scene.events.trigger_key_release(key)
+        self._profiled("events",
+                       self.current_scene.events.trigger_key_release, key)
+
+
+class HeadlessWindow:
+    """
+    Stand-in for an arcade window, exposing just enough for scenes, widgets
+    and animations to work without a GL context.
+    """
+
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.curtains = None
+        self._resize_handlers = []
+
+    def get_size(self):
+        return self.width, self.height
+
+    def set_size(self, width, height):
+        self.width = width
+        self.height = height
+        for handler in self._resize_handlers:
+            handler(width, height)
+
+    def push_handlers(self, on_resize=None, **handlers):
+        if on_resize:
+            self._resize_handlers.append(on_resize)
+
+
+class HeadlessCurtains(Curtains):
+    """
+    A Curtains instance that isn't bound to an arcade window. Frames and input
+    are driven by the caller with synthetic deltas, as fast as the CPU allows.
+    Scenes are never drawn, but before_draw and after_draw events are fired.
+    """
+
+    def __init__(self, width=800, height=600, delta_time=1 / 60, **kwargs):
+        super().__init__(**kwargs)
+        self.delta_time = delta_time
+        self.frame_count = 0
+        self.elapsed_time = 0
+        self.mouse_x = 0
+        self.mouse_y = 0
+        self.window = HeadlessWindow(width, height)
+        self.window.curtains = self
+        # Sprite animations and widgets look up curtains through the window
+        arcade.set_window(self.window)
+
+    def bind(self, window=None):
+        msg = "A headless Curtains instance can't be bound to a window"
+        raise Exception(msg)
+
+    def _draw(self):
+        self.current_scene.events.trigger_before_draw()
+        self.current_scene.events.trigger_after_draw()
+
+    def on_draw(self):
+        self._profiled("draw", self._draw)
+        self._end_frame()
+
+    def advance(self, delta_time=None):
+        if delta_time is None:
+            delta_time = self.delta_time
+        self.update(delta_time)
+        self.on_draw()
+        self.frame_count += 1
+        self.elapsed_time += delta_time
+
+    def run(self, frames=1, delta_time=None, until=None):
+        """
+        Run a number of frames, or stop early when `until` returns True.
+        Returns the amount of frames that were run.
+        """
+        for frame in range(frames):
+            if until and until():
+                return frame
+            self.advance(delta_time)
+        return frames
+
+    def resize(self, width, height):
+        self.window.set_size(width, height)
+
+    def move(self, x, y):
+        dx, dy = x - self.mouse_x, y - self.mouse_y
+        self.mouse_x, self.mouse_y = x, y
+        self.on_mouse_motion(x, y, dx, dy)
+
+    def press(self, x, y, button=arcade.MOUSE_BUTTON_LEFT):
+        self.move(x, y)
+        self.on_mouse_press(x, y, button, 0)
+
+    def release(self, x, y, button=arcade.MOUSE_BUTTON_LEFT):
+        self.move(x, y)
+        self.on_mouse_release(x, y, button, 0)
+
+    def click(self, x, y, button=arcade.MOUSE_BUTTON_LEFT):
+        self.press(x, y, button)
+        self.release(x, y, button)
+
+    def drag(self, x, y, button=arcade.MOUSE_BUTTON_LEFT):
+        dx, dy = x - self.mouse_x, y - self.mouse_y
+        self.mouse_x, self.mouse_y = x, y
+        self.on_mouse_drag(x, y, dx, dy, button, 0)
+
+    def key_press(self, key):
+        self.on_key_press(key, 0)
+
+    def key_release(self, key):
+        self.on_key_release(key, 0)
+
+    def tap(self, key):
+        self.key_press(key)
+        self.key_release(key)
@@ -43,6 +43,8 @@ class NoActiveSceneException(Exception):
 class AnimationManager:
     def __init__(self):
         self.animations = []
+        self.time_scale = 1
+        self.paused = False
 
     def fire(self, sprite, sequence):
         if isinstance(sequence, Sequence):
@@ -54,7 +56,25 @@ class AnimationManager:
                 sequence.__class__.__name__))
         self.animations.append(animator)
 
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def step(self, delta=1 / 60):
+        """
+        Advance all animations by a single delta, regardless of the manager
+        being paused. Mostly useful to single-step through a paused scene.
+        """
+        self._advance(delta * self.time_scale)
+
     def _blip(self, delta):
+        if self.paused:
+            return
+        self._advance(delta * self.time_scale)
+
+    def _advance(self, delta):
         for animator in self.animations[:]:
             animator.blip(delta)
             if animator.finished:
@@ -0,0 +1,115 @@
+import math
+
+import arcade
+
+
+class ChunkedSpriteList:
+    """
+    Draws a large amount of static sprites, like the tiles of a map, from a
+    spritelist per square chunk of the world. Only the chunks overlapping the
+    viewport are drawn, so the cost of a frame depends on what is on screen
+    rather than on the size of the world.
+
+    Sprites are put in a chunk by their position when they're added. Call
+    `move` after moving a sprite to put it in the right chunk again. Chunks
+    are static spritelists unless `is_static` is False, their buffers are
+    only rebuilt when sprites are added, removed or moved through `move`.
+
+    By default the viewport is the area arcade draws, following the camera
+    set with `arcade.set_viewport`. Any object with `bounds` as (left,
+    bottom, right, top), like a `Viewport`, can be passed instead.
+    """
+
+    def __init__(self, sprites=(), chunk_size=512, viewport=None,
+                 is_static=True):
+        self.chunk_size = chunk_size
+        self.is_static = is_static
+        self.viewport = viewport
+        self.chunks = {}
+        self._chunk_of = {}
+        self._reach = 0
+        self._visible_key = None
+        self._visible = []
+        self.extend(sprites)
+
+    def __len__(self):
+        return len(self._chunk_of)
+
+    def __iter__(self):
+        return iter(self._chunk_of)
+
+    def __contains__(self, sprite):
+        return sprite in self._chunk_of
+
+    def _key(self, x, y):
+        return (math.floor(x / self.chunk_size),
+                math.floor(y / self.chunk_size))
+
+    def append(self, sprite):
+        key = self._key(*sprite.position)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = arcade.SpriteList(
+                use_spatial_hash=False, is_static=self.is_static)
+        chunk.append(sprite)
+        self._chunk_of[sprite] = key
+        # how far a sprite, at any angle, can reach outside of its chunk
+        self._reach = max(self._reach,
+                          math.hypot(sprite.width, sprite.height) / 2)
+        self._visible_key = None
+
+    def extend(self, sprites):
+        for sprite in sprites:
+            self.append(sprite)
+
+    def remove(self, sprite):
+        key = self._chunk_of.pop(sprite)
+        chunk = self.chunks[key]
+        if chunk in sprite.sprite_lists:
+            chunk.remove(sprite)
+        if not len(chunk):
+            del self.chunks[key]
+        self._visible_key = None
+
+    def move(self, sprite):
+        """
+        Put a sprite that was moved in the chunk of its new position.
+        """
+        if (self.is_static
+                or self._key(*sprite.position) != self._chunk_of[sprite]):
+            self.remove(sprite)
+            self.append(sprite)
+
+    def _bounds(self):
+        if self.viewport is not None:
+            return tuple(self.viewport.bounds)
+        left, right, bottom, top = arcade.get_viewport()
+        return (left, bottom, right, top)
+
+    def visible_chunks(self):
+        left, bottom, right, top = self._bounds()
+        reach = self._reach
+        first = self._key(left - reach, bottom - reach)
+        last = self._key(right + reach, top + reach)
+        if (first, last) != self._visible_key:
+            self._visible_key = (first, last)
+            self._visible = self._chunks_between(first, last)
+        return self._visible
+
+    def _chunks_between(self, first, last):
+        columns = range(first[0], last[0] + 1)
+        rows = range(first[1], last[1] + 1)
+        if len(columns) * len(rows) > len(self.chunks):
+            # zoomed out far, there are less chunks than cells to look at
+            return [
+                chunk for (x, y), chunk in self.chunks.items()
+                if x in columns and y in rows
+            ]
+        return [
+            self.chunks[key] for key in ((x, y) for y in rows for x in columns)
+            if key in self.chunks
+        ]
+
+    def draw(self, **kwargs):
+        for chunk in self.visible_chunks():
+            chunk.draw(**kwargs)
@@ -5,6 +5,8 @@ from unittest.mock import Mock
 
 import arcade
 
+from .profiler import HandlerProfiler
+
 
 class SpriteEvent(Enum):
     CLICK = 1
@@ -44,62 +46,115 @@ class EventTriggersMixin:
             self._previous_hover = current_hover
 
     def trigger_mouse_move(self, x, y):
-        run_handlers(self.handlers[Event.MOUSE_MOVE], x, y)
+        self._run_handlers(Event.MOUSE_MOVE, self.handlers[Event.MOUSE_MOVE],
+                           x, y)
 
     def trigger_hover_out(self, sprite, x, y):
         handlers = self.sprite_handlers[SpriteEvent.OUT].get(sprite, [])
-        run_handlers(handlers, sprite, x, y)
+        self._run_handlers(SpriteEvent.OUT, handlers, sprite, x, y)
 
     def trigger_hover(self, sprite, x, y):
         handlers = self.sprite_handlers[SpriteEvent.HOVER].get(sprite, [])
-        run_handlers(handlers, sprite, x, y)
+        self._run_handlers(SpriteEvent.HOVER, handlers, sprite, x, y)
 
     def trigger_down(self, x, y):
         current_down = self._get_sprite_at(x, y)
         handlers = self.sprite_handlers[SpriteEvent.DOWN].get(current_down, [])
-        run_handlers(handlers, current_down, x, y)
+        self._run_handlers(SpriteEvent.DOWN, handlers, current_down, x, y)
         self._previous_down = current_down
 
     def trigger_up(self, x, y):
         current_up = self._get_sprite_at(x, y)
         handlers = self.sprite_handlers[SpriteEvent.UP].get(current_up, [])
-        run_handlers(handlers, current_up, x, y)
+        self._run_handlers(SpriteEvent.UP, handlers, current_up, x, y)
         if current_up is self._previous_down:
             self.trigger_click(current_up, x, y)
         self._previous_down = EMPTY_SPRITE
 
     def trigger_click(self, sprite, x, y):
         handlers = self.sprite_handlers[SpriteEvent.CLICK].get(sprite, [])
-        run_handlers(handlers, sprite, x, y)
+        self._run_handlers(SpriteEvent.CLICK, handlers, sprite, x, y)
 
     def trigger_drag(self, x, y, dx, dy):
         drag_sprites = self.sprite_handlers[SpriteEvent.DRAG]
         handlers = drag_sprites.get(self._previous_down, [])
-        run_handlers(handlers, self._previous_down, x, y, dx, dy)
+        self._run_handlers(SpriteEvent.DRAG, handlers, self._previous_down, x,
+                           y, dx, dy)
 
     def trigger_frame(self, delta_time):
-        run_handlers(self.handlers[Event.FRAME], delta_time)
+        self._run_handlers(Event.FRAME, self.handlers[Event.FRAME],
+                           delta_time)
 
     def trigger_before_draw(self):
-        run_handlers(self.handlers[Event.BEFORE_DRAW])
+        self._run_handlers(Event.BEFORE_DRAW, self.handlers[Event.BEFORE_DRAW])
 
     def trigger_after_draw(self):
-        run_handlers(self.handlers[Event.AFTER_DRAW])
+        self._run_handlers(Event.AFTER_DRAW, self.handlers[Event.AFTER_DRAW])
 
     def trigger_key_press(self, key):
-        run_handlers(self.handlers.get((Event.KEY_DOWN, key), []))
+        event_type = (Event.KEY_DOWN, key)
+        self._run_handlers(event_type, self.handlers.get(event_type, []))
 
     def trigger_key_release(self, key):
-        run_handlers(self.handlers.get((Event.KEY_UP, key), []))
+        event_type = (Event.KEY_UP, key)
+        self._run_handlers(event_type, self.handlers.get(event_type, []))
+
+    def _run_handlers(self, event_type, handlers, *args, **kwargs):
+        if self.profiler:
+            self.profiler.run_handlers(self, event_type, handlers, *args,
+                                       **kwargs)
+        else:
+            run_handlers(handlers, *args, **kwargs)
 
     def _get_sprite_at(self, *coords):
         sprites = arcade.SpriteList()
-        sprites.sprite_list = self.all_sprites
+        if self.containers:
+            sprites.sprite_list = self._sprites_near(coords)
+        else:
+            sprites.sprite_list = self.all_sprites
         sprites = arcade.get_sprites_at_point(coords, sprites)
         if sprites:
             return max(sprites)
         return EMPTY_SPRITE
 
+    def _sprites_near(self, point):
+        """
+        Sprites that aren't part of a container, and the sprites of the
+        showing widgets under `point`. Widgets that don't contain the point
+        are skipped, along with the widgets nested in them.
+        """
+        loose, registered = self._split_sprites()
+        sprites = list(loose)
+        widgets = self.containers[::-1]
+        while widgets:
+            widget = widgets.pop()
+            if not widget.showing or not widget.collides_with_point(point):
+                continue
+            sprites.extend(
+                sprite for sprite in widget.spritelist if sprite in registered)
+            widgets.extend(widget.children[::-1])
+        return sprites
+
+    def _split_sprites(self):
+        key = (id(self.all_sprites), len(self.all_sprites),
+               self._containers_version,
+               tuple(widget.tree_version for widget in self.containers))
+        if self._split_key != key:
+            contained = set()
+            widgets = list(self.containers)
+            while widgets:
+                widget = widgets.pop()
+                contained.update(widget.spritelist)
+                widgets.extend(widget.children)
+            registered = set(self.all_sprites)
+            loose = [
+                sprite for sprite in self.all_sprites
+                if sprite not in contained
+            ]
+            self._split = (loose, registered)
+            self._split_key = key
+        return self._split
+
 
 class EventHelperMixin:
     def add_sprite_event(self, event_type, sprite, handler_function, *args,
@@ -113,6 +168,21 @@ class EventHelperMixin:
         if handler_function not in self.handlers[event_type]:
             self.handlers[event_type].append((handler_function, args, kwargs))
 
+    def add_container(self, widget):
+        """
+        Hit-test the sprites of a widget, and the widgets nested in it,
+        through the widget's bounds. Sprites of hidden widgets, or of widgets
+        that aren't under the mouse, aren't tested at all.
+        """
+        if widget not in self.containers:
+            self.containers.append(widget)
+            self._containers_version += 1
+
+    def remove_container(self, widget):
+        if widget in self.containers:
+            self.containers.remove(widget)
+            self._containers_version += 1
+
     def remove_sprite_event(self, event_type, sprite, handler):
         if self.sprite_handlers[event_type].get(sprite, None):
             for details in self.sprite_handlers[event_type][sprite]:
@@ -132,7 +202,8 @@ class EventHelperMixin:
         for event in SpriteEvent:
             self.sprite_handlers[event].pop(sprite, None)
         for attribute_name in dir(sprite):
-            attr = getattr(sprite, attribute_name)
+            # observed attributes are listed before they are ever assigned
+            attr = getattr(sprite, attribute_name, None)
             if callable(attr):
                 for event in Event:
                     self.remove_event(event, attr)
@@ -175,16 +246,21 @@ class EventHelperMixin:
 
 
 class EventGroup(EventHelperMixin, EventTriggersMixin):
-    def __init__(self):
+    def __init__(self, name=None):
+        self.name = name
         self.sprite_handlers = defaultdict(lambda: defaultdict(list))
         self.handlers = defaultdict(list)
 
         self.all_sprites = []
+        self.containers = []
+        self._containers_version = 0
+        self._split_key = None
 
         self._previous_hover = EMPTY_SPRITE
         self._previous_down = EMPTY_SPRITE
 
         self._enabled = True
+        self.profiler = None
 
     def disable(self):
         self._enabled = False
@@ -197,8 +273,9 @@ class EventHandler:
     def __init__(self):
         self.current_x = 0
         self.current_y = 0
+        self.profiler = None
 
-        self.event_group = EventGroup()
+        self.event_group = EventGroup("default")
         self.event_groups = [self.event_group]
         self._valid_functions = dir(self.event_group)
 
@@ -221,8 +298,21 @@ class EventHandler:
                 group.trigger_mouse_events(x, y)
 
     def register_group(self, group):
+        group.profiler = self.profiler
         self.event_groups.append(group)
 
+    def set_profiler(self, profiler):
+        self.profiler = profiler
+        for group in self.event_groups:
+            group.profiler = profiler
+
+    def enable_profiling(self, budget=None):
+        self.set_profiler(HandlerProfiler(budget=budget))
+        return self.profiler
+
+    def disable_profiling(self):
+        self.set_profiler(None)
+
     def _execute_trigger(self, fn_name, *args, **kwargs):
         for group in self.event_groups:
             if group._enabled:
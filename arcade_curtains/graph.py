@@ -0,0 +1,451 @@
+from contextvars import ContextVar
+import math
+
+import numpy as np
+
+CURRENT_GRAPH = ContextVar("graph", default=None)
+
+
+def rotate(x, y, angle):
+    rad = math.radians(angle)
+    cos, sin = math.cos(rad), math.sin(rad)
+    return cos * x - sin * y, sin * x + cos * y
+
+
+def transform_matrix(x, y, angle, scale):
+    rad = math.radians(angle)
+    cos, sin = math.cos(rad) * scale, math.sin(rad) * scale
+    return np.array([[cos, -sin, x], [sin, cos, y], [0, 0, 1]])
+
+
+def _place(sprite, x, y):
+    observed = getattr(sprite, "_observed_attributes", ())
+    if "center_x" in observed or "center_y" in observed:
+        # observers of the coordinates are notified like they used to be
+        if sprite.center_x != x:
+            sprite.center_x = x
+        if sprite.center_y != y:
+            sprite.center_y = y
+    else:
+        sprite.position = (x, y)
+
+
+
+class GraphNode:
+    """
+    Handle to a node of a `SceneGraph`. It can be used wherever an
+    `AnchorPoint` is used: `position`, `center_x`, `center_y`, `angle` and
+    `scale` are world values, and sprites or other nodes can be docked to it.
+
+    Transforming a node only updates its local transform and marks it dirty,
+    the world transforms of everything docked to it are calculated on
+    `SceneGraph.update`.
+    """
+
+    def __init__(self, graph, index):
+        self.graph = graph
+        self.index = index
+
+    def dock(self, boat):
+        if isinstance(boat, GraphNode):
+            if boat.graph is not self.graph:
+                raise ValueError("Can't dock a node of another scene graph")
+            self.graph.reparent(boat.index, self.index)
+        else:
+            self.graph.add_sprite(boat, parent=self)
+
+    @property
+    def parent(self):
+        index = self.graph.parents[self.index]
+        if index < 0:
+            return None
+        return GraphNode(self.graph, index)
+
+    @property
+    def local_position(self):
+        x, y = self.graph.local[self.index]
+        return float(x), float(y)
+
+    @local_position.setter
+    def local_position(self, value):
+        self.graph.set_local(self.index, *value)
+
+    @property
+    def position(self):
+        return self.graph.world_position(self.index)
+
+    @position.setter
+    def position(self, value):
+        self.graph.set_position(self.index, *value)
+
+    @property
+    def center_x(self):
+        return self.position[0]
+
+    @center_x.setter
+    def center_x(self, value):
+        self.position = (value, self.center_y)
+
+    @property
+    def center_y(self):
+        return self.position[1]
+
+    @center_y.setter
+    def center_y(self, value):
+        self.position = (self.center_x, value)
+
+    def move(self, dx, dy):
+        self.graph.move(self.index, dx, dy)
+
+    def watch(self, callback):
+        """
+        Call `callback()` whenever the node is transformed, and on
+        `SceneGraph.update` when a node it is docked to was.
+        """
+        self.graph.watchers.setdefault(self.index, []).append(callback)
+
+    @property
+    def angle(self):
+        return self.graph.world_transform(self.index)[2]
+
+    @angle.setter
+    def angle(self, value):
+        self.rotate(value - self.angle)
+
+    def rotate(self, angle):
+        self.graph.transform(self.index, angle=angle)
+
+    @property
+    def scale(self):
+        return self.graph.world_transform(self.index)[3]
+
+    @scale.setter
+    def scale(self, value):
+        self.graph.transform(self.index, scale=value / self.scale)
+
+    @property
+    def matrix(self):
+        """
+        The world transform of this node as a 3x3 affine matrix.
+        """
+        return transform_matrix(*self.graph.world_transform(self.index))
+
+    def __eq__(self, other):
+        return (isinstance(other, GraphNode) and other.graph is self.graph
+                and other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self.graph), self.index))
+
+
+class SceneGraph:
+    """
+    Flattened transform hierarchy. Every node stores its translation, rotation
+    and uniform scale relative to its parent, and its cached world transform,
+    in arrays indexed by a parent-index array. With only rotations and uniform
+    scales, an affine matrix is fully described by a translation, an angle and
+    a scale, which is how world transforms are kept.
+
+    Transforming a node marks it dirty. `update` propagates the dirty flags
+    down the hierarchy, one depth level at a time, composes the world
+    transforms of the dirty nodes in a vectorized pass and writes them to the
+    docked sprites. Untouched subtrees cost nothing.
+
+    Widgets created within `with graph:` are placed in the graph, as are the
+    widgets nested in them.
+    """
+
+    ARRAYS = {
+        "parents": (-1, np.intp),
+        "local": (0, float),
+        "local_angle": (0, float),
+        "local_scale": (1, float),
+        "world": (0, float),
+        "world_angle": (0, float),
+        "world_scale": (1, float),
+        "written": (0, float),
+        "written_angle": (0, float),
+        "written_scale": (1, float),
+        "dirty": (False, bool),
+        "has_sprite": (False, bool),
+    }
+    POINT_ARRAYS = ("local", "world", "written")
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        for name, (fill, dtype) in self.ARRAYS.items():
+            shape = (capacity, 2) if name in self.POINT_ARRAYS else capacity
+            setattr(self, name, np.full(shape, fill, dtype=dtype))
+        self.sprites = []
+        self.sprite_nodes = {}
+        self.watchers = {}
+        # only translations so far, which allows a cheaper update
+        self.transformed = False
+        self._levels = None
+        self._tokens = []
+
+    def __len__(self):
+        return self.size
+
+    def __enter__(self):
+        self._tokens.append(CURRENT_GRAPH.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        CURRENT_GRAPH.reset(self._tokens.pop())
+
+    def _grow(self):
+        capacity = len(self.dirty)
+        if self.size < capacity:
+            return
+        for name, (fill, dtype) in self.ARRAYS.items():
+            array = getattr(self, name)
+            grown = np.full((capacity * 2, ) + array.shape[1:], fill,
+                            dtype=dtype)
+            grown[:capacity] = array
+            setattr(self, name, grown)
+
+    def add_node(self, position=(0, 0), parent=None, sprite=None, angle=0,
+                 scale=1):
+        """
+        Add a node with world `position`, `angle` and `scale`, docked to the
+        `parent` node.
+        """
+        self._grow()
+        index = self.size
+        self.size += 1
+        self._dock(index, -1 if parent is None else parent.index,
+                   position, angle, scale)
+        self.world[index] = self.written[index] = position
+        self.world_angle[index] = self.written_angle[index] = angle
+        self.world_scale[index] = self.written_scale[index] = scale
+        self.has_sprite[index] = sprite is not None
+        self.sprites.append(sprite)
+        if sprite is not None:
+            self.sprite_nodes[sprite] = index
+        elif angle or scale != 1:
+            self.transformed = True
+        return GraphNode(self, index)
+
+    def add_sprite(self, sprite, parent=None):
+        """
+        Dock a sprite to the `parent` node. A sprite that is already in the
+        graph is docked to its new parent instead of being added twice.
+        """
+        index = self.sprite_nodes.get(sprite)
+        if index is None:
+            return self.add_node(sprite.position, parent=parent,
+                                 sprite=sprite, angle=sprite.angle,
+                                 scale=sprite.scale)
+        self.reparent(index, -1 if parent is None else parent.index)
+        return GraphNode(self, index)
+
+    def remove_sprite(self, sprite):
+        """
+        Stop writing to a sprite, for instance when it's killed. Its node
+        stays in the graph without a sprite, so nodes docked to it keep their
+        place.
+        """
+        index = self.sprite_nodes.pop(sprite, None)
+        if index is None:
+            return
+        self.sprites[index] = None
+        self.has_sprite[index] = False
+
+    def world_transform(self, index):
+        """
+        The up to date world `(x, y, angle, scale)` of a node, regardless of
+        its dirty state.
+        """
+        path = []
+        while index >= 0:
+            path.append(index)
+            index = self.parents[index]
+        x = y = angle = 0.
+        scale = 1.
+        for node in reversed(path):
+            dx, dy = rotate(*self.local[node], angle)
+            x += dx * scale
+            y += dy * scale
+            angle += self.local_angle[node]
+            scale *= self.local_scale[node]
+        return float(x), float(y), float(angle), float(scale)
+
+    def world_position(self, index):
+        return self.world_transform(index)[:2]
+
+    def _to_local(self, parent_index, x, y):
+        px, py, angle, scale = self.world_transform(parent_index)
+        dx, dy = rotate(x - px, y - py, -angle)
+        return dx / scale, dy / scale
+
+    def _dock(self, index, parent_index, position, angle, scale):
+        self.parents[index] = parent_index
+        self.local[index] = self._to_local(parent_index, *position)
+        parent_angle, parent_scale = 0, 1
+        if parent_index >= 0:
+            _, _, parent_angle, parent_scale = self.world_transform(
+                parent_index)
+            local_angle = self.local_angle[parent_index]
+            if local_angle or self.local_scale[parent_index] != 1:
+                self.transformed = True
+        self.local_angle[index] = angle - parent_angle
+        self.local_scale[index] = scale / parent_scale
+        self._levels = None
+
+    def set_local(self, index, x, y):
+        self.local[index] = (x, y)
+        self.dirty[index] = True
+        self._notify(index)
+
+    def _notify(self, index):
+        for callback in self.watchers.get(index, ()):
+            callback()
+
+    def set_position(self, index, x, y):
+        self.set_local(index, *self._to_local(self.parents[index], x, y))
+
+    def move(self, index, dx, dy):
+        if not dx and not dy:
+            return
+        x, y = self.world_position(index)
+        self.set_position(index, x + dx, y + dy)
+
+    def transform(self, index, angle=0, scale=1):
+        """
+        Rotate a node by `angle` degrees and multiply its scale by `scale`,
+        along with everything docked to it.
+        """
+        if not angle and scale == 1:
+            return
+        self.local_angle[index] += angle
+        self.local_scale[index] *= scale
+        self.dirty[index] = True
+        self.transformed = True
+        self._notify(index)
+
+    def reparent(self, index, parent_index):
+        """
+        Dock a node to another parent, keeping its world transform.
+        """
+        ancestor = parent_index
+        while ancestor >= 0:
+            if ancestor == index:
+                raise ValueError("Can't dock a node to one of its children")
+            ancestor = self.parents[ancestor]
+        if self.has_sprite[index]:
+            sprite = self.sprites[index]
+            transform = (sprite.position, sprite.angle, sprite.scale)
+            self.written[index] = sprite.position
+            self.written_angle[index] = sprite.angle
+            self.written_scale[index] = sprite.scale
+        else:
+            x, y, angle, scale = self.world_transform(index)
+            transform = ((x, y), angle, scale)
+        self._dock(index, parent_index, *transform)
+
+    def _get_levels(self):
+        if self._levels is None:
+            parents = self.parents
+            depth = np.full(self.size, -1, dtype=np.intp)
+            for index in range(self.size):
+                path = []
+                while index >= 0 and depth[index] < 0:
+                    path.append(index)
+                    index = parents[index]
+                level = depth[index] if index >= 0 else -1
+                for node in reversed(path):
+                    level += 1
+                    depth[node] = level
+            self._levels = [
+                np.flatnonzero(depth == level)
+                for level in range(depth.max() + 1 if self.size else 0)
+            ]
+        return self._levels
+
+    def update(self, *args):
+        """
+        Recalculate the world transforms of all dirty nodes and their
+        descendants, and write them to their sprites. Can be used as an event
+        handler, a `BaseScene` calls it before every draw.
+        """
+        dirty = self.dirty[:self.size]
+        if not dirty.any():
+            return
+        parents = self.parents
+        for depth, level in enumerate(self._get_levels()):
+            if depth:
+                dirty[level] |= dirty[parents[level]]
+            changed = level[dirty[level]]
+            if not len(changed):
+                continue
+            if depth:
+                self._compose(changed, parents[changed])
+            else:
+                self.world[changed] = self.local[changed]
+                self.world_angle[changed] = self.local_angle[changed]
+                self.world_scale[changed] = self.local_scale[changed]
+        self._write(np.flatnonzero(dirty & self.has_sprite[:self.size]))
+        for index in self.watchers:
+            if dirty[index]:
+                self._notify(index)
+        dirty[:] = False
+
+    def _compose(self, indices, parents):
+        local, world = self.local[indices], self.world[parents]
+        if not self.transformed:
+            self.world[indices] = world + local
+            return
+        angle, scale = self.world_angle[parents], self.world_scale[parents]
+        self.world[indices] = world + _rotate(local, angle) * scale[:, None]
+        self.world_angle[indices] = angle + self.local_angle[indices]
+        self.world_scale[indices] = scale * self.local_scale[indices]
+
+    def _write(self, indices):
+        if not len(indices):
+            return
+        sprites = [self.sprites[index] for index in indices.tolist()]
+        # sprites transformed outside of the graph keep their offset
+        offset = np.array([sprite.position for sprite in sprites], dtype=float)
+        offset -= self.written[indices]
+        self.world[indices] += offset
+        if not self.transformed:
+            self.local[indices] += offset
+            self._write_positions(sprites, indices)
+            return
+        parents = self.parents[indices]
+        has_parent = parents >= 0
+        angle = np.where(has_parent, self.world_angle[parents], 0)
+        scale = np.where(has_parent, self.world_scale[parents], 1)
+        self.local[indices] += _rotate(offset, -angle) / scale[:, None]
+
+        angles = np.array([sprite.angle for sprite in sprites], dtype=float)
+        angles -= self.written_angle[indices]
+        self.local_angle[indices] += angles
+        self.world_angle[indices] += angles
+        scales = np.array([sprite.scale for sprite in sprites], dtype=float)
+        written_scale = self.written_scale[indices]
+        ratio = np.divide(scales, written_scale, out=np.ones_like(scales),
+                          where=written_scale != 0)
+        self.local_scale[indices] *= ratio
+        self.world_scale[indices] *= ratio
+
+        self._write_positions(sprites, indices)
+        angles = self.written_angle[indices] = self.world_angle[indices]
+        scales = self.written_scale[indices] = self.world_scale[indices]
+        for sprite, angle, scale in zip(sprites, angles.tolist(),
+                                        scales.tolist()):
+            sprite.angle = angle
+            sprite.scale = scale
+
+    def _write_positions(self, sprites, indices):
+        positions = self.written[indices] = self.world[indices]
+        for sprite, (x, y) in zip(sprites, positions.tolist()):
+            _place(sprite, x, y)
+
+
+def _rotate(points, angles):
+    rad = np.radians(angles)
+    cos, sin = np.cos(rad), np.sin(rad)
+    x, y = points[:, 0], points[:, 1]
+    return np.stack((cos * x - sin * y, sin * x + cos * y), axis=1)
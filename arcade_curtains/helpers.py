@@ -1,10 +1,15 @@
 from contextvars import ContextVar
-from collections import defaultdict
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
+import math
+import operator
+import time
+import weakref
 
 import arcade
+import numpy as np
 
 from .animation import AnimationManagerProxy
+from .graph import CURRENT_GRAPH, _place
 
 CURRENT_WIDGET = ContextVar("widget", default=None)
 
@@ -94,6 +99,44 @@ class Sprite(arcade.Sprite, PositionHelperMixin, metaclass=CurtainsMeta):
         return self.layer <= other.layer
 
 
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+IDENTITY_OPERATORS = {
+    "==": operator.is_,
+    "!=": operator.is_not,
+}
+
+# tuple values, like a position, are equal when all of their items are
+ARRAY_REDUCTIONS = {
+    "==": np.all,
+    "!=": np.any,
+}
+
+
+@lru_cache(maxsize=None)
+def predicate(attribute, op, value_type):
+    """
+    Builds a check comparing the attribute of an object with a value, as a
+    function of (value, obj, new_value). Checks are cached, so all triggers
+    on the same attribute, operator and value type share the same function.
+    """
+    compare = OPERATORS[op]
+    if value_type is type(None):
+        compare = IDENTITY_OPERATORS.get(op, compare)
+    get = operator.attrgetter(attribute)
+
+    def check(value, obj, new_value):
+        return compare(get(obj), value)
+
+    return check
+
+
 class TriggerAttr:
     def __init__(self, attribute):
         self.attribute = attribute
@@ -116,61 +159,452 @@ class TriggerAttr:
     def __le__(self, other):
         return Trigger(self.attribute, "<=", other)
 
+    def between(self, low, high):
+        return (self >= low) & (self <= high)
 
-class Trigger:
-    def __init__(self, attribute, op, value):
+
+class BaseTrigger:
+    def __and__(self, other):
+        return CompoundTrigger(all, (self, other))
+
+    def __or__(self, other):
+        return CompoundTrigger(any, (self, other))
+
+    def edge(self):
         """
-        Nothing beats the speed of using relational operators, and getting
-        attributes through dot accessing. Since this check might potentially
-        be executed a good amount of times, we want to bake the check to be
-        as fast as possible.
+        Only fire when the check goes from false to true, instead of on every
+        change for which the check holds.
         """
-        self.attribute = attribute
-        self.op = op
-        self.value = value
+        return EdgeTrigger(self)
+
+    def once(self):
+        """
+        Only fire the first time the check holds.
+        """
+        return OnceTrigger(self)
+
+    def debounce(self, interval, clock=time.monotonic):
+        """
+        Fire at most once every `interval` seconds, as measured by `clock`.
+        """
+        return DebouncedTrigger(self, interval, clock)
+
+    def compile(self):
+        """
+        Returns the check as a function of the observed object and the new
+        value. It is only built once per trigger, so a trigger declared on a
+        class is compiled once for all of its instances.
+        """
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
 
     def bake(self, obj):
-        expression = "lambda s, x: s.{} {} {}".format(self.attribute, self.op,
-                                                      self.value)
-        self.check = partial(eval(expression), obj)
+        self.check = partial(self.compile(), obj)
 
     def check(self, other):
         raise NotImplementedError(
             "Trigger is not yet baked. Call bake() first")
 
 
-class ObservableSprite(Sprite):
-    BEFORE_CHANGE = 0
-    AFTER_CHANGE = 1
-    TRIGGER = 2
+class Trigger(BaseTrigger):
+    def __init__(self, attribute, op, value):
+        """
+        Checks are built from the operator module instead of evaluated
+        source, so any value can be compared against, and the functions
+        doing the comparison are shared between triggers.
+        """
+        self.attribute = attribute
+        self.attributes = (attribute, )
+        self.op = op
+        self.value = value
+        self._compiled = None
+
+    def _compile(self):
+        check = predicate(self.attribute, self.op, type(self.value))
+        return partial(check, self.value)
+
+    def evaluate(self, columns, states):
+        result = np.asarray(OPERATORS[self.op](columns[self.attribute],
+                                               self.value), dtype=bool)
+        if result.ndim > 1:
+            reduce = ARRAY_REDUCTIONS.get(self.op)
+            if reduce is None:
+                raise ValueError(
+                    "{} can only be compared with == or != when evaluated "
+                    "for a group of sprites".format(self.attribute))
+            result = reduce(result.reshape(len(result), -1), axis=1)
+        return result
+
+
+class CompoundTrigger(BaseTrigger):
+    def __init__(self, combine, triggers):
+        self.combine = combine
+        self.triggers = []
+        for trigger in triggers:
+            if isinstance(trigger, CompoundTrigger) and trigger.combine is combine:
+                self.triggers.extend(trigger.triggers)
+            else:
+                self.triggers.append(trigger)
+        self.attributes = tuple(
+            dict.fromkeys(a for t in self.triggers for a in t.attributes))
+        self._compiled = None
+
+    def _compile(self):
+        checks = tuple(trigger.compile() for trigger in self.triggers)
+        combine = self.combine
+
+        def check(obj, new_value):
+            return combine(fn(obj, new_value) for fn in checks)
+
+        return check
+
+    def evaluate(self, columns, states):
+        reduce = np.logical_and if self.combine is all else np.logical_or
+        return reduce.reduce(
+            [trigger.evaluate(columns, states) for trigger in self.triggers])
+
+
+class GatedTrigger(BaseTrigger):
+    """
+    Wraps a trigger to decide whether a passing check should fire. The state
+    this decision is based on is kept per observed object, so a gated trigger
+    can be shared by all instances of a class.
+    """
 
-    def __init__(self, *args, **kwargs):
-        super().__setattr__(
-            "_observe",
-            defaultdict(lambda: [list(), list(), dict()]))
-        super().__init__(*args, **kwargs)
+    initial_state = None
+
+    def __init__(self, trigger):
+        self.trigger = trigger
+        self.attributes = trigger.attributes
+        self._compiled = None
+
+    def gate(self, state, result):
+        raise NotImplementedError()
+
+    def _compile(self):
+        check = self.trigger.compile()
+        gate = self.gate
+        initial_state = self.initial_state
+
+        def gated(obj, new_value):
+            states = obj.__dict__.get("_trigger_states")
+            if states is None:
+                states = obj.__dict__["_trigger_states"] = {}
+            fire, states[self] = gate(
+                states.get(self, initial_state), check(obj, new_value))
+            return fire
+
+        return gated
+
+    def initial_array(self, size):
+        return np.zeros(size, dtype=bool)
+
+    def gate_array(self, state, result):
+        raise NotImplementedError()
+
+    def evaluate(self, columns, states):
+        result = self.trigger.evaluate(columns, states)
+        state = states.get(self)
+        if state is None:
+            state = self.initial_array(len(result))
+        fire, states[self] = self.gate_array(state, result)
+        return fire
+
+
+class EdgeTrigger(GatedTrigger):
+    initial_state = False
+
+    def gate(self, previous, result):
+        return result and not previous, result
+
+    def gate_array(self, previous, result):
+        return result & ~previous, result
+
+
+class OnceTrigger(GatedTrigger):
+    initial_state = False
+
+    def gate(self, fired, result):
+        return result and not fired, fired or result
+
+    def gate_array(self, fired, result):
+        return result & ~fired, fired | result
+
+
+class DebouncedTrigger(GatedTrigger):
+    def __init__(self, trigger, interval, clock=time.monotonic):
+        super().__init__(trigger)
+        self.interval = interval
+        self.clock = clock
+
+    def gate(self, last_fired, result):
+        if not result:
+            return False, last_fired
+        now = self.clock()
+        if last_fired is not None and now - last_fired < self.interval:
+            return False, last_fired
+        return True, now
+
+    def initial_array(self, size):
+        return np.full(size, np.nan)
+
+    def gate_array(self, last_fired, result):
+        now = self.clock()
+        ready = np.isnan(last_fired) | (now - last_fired >= self.interval)
+        fire = result & ready
+        return fire, np.where(fire, now, last_fired)
+
+
+SPRITE_LIST_BUFFERS = {
+    "center_x": ("_sprite_pos_data", np.float32, 2, 0),
+    "center_y": ("_sprite_pos_data", np.float32, 2, 1),
+    "width": ("_sprite_size_data", np.float32, 2, 0),
+    "height": ("_sprite_size_data", np.float32, 2, 1),
+    "alpha": ("_sprite_color_data", np.uint8, 4, 3),
+}
 
-    def __setattr__(self, key, value):
-        if key in self._observe:
-            old = getattr(self, key, None)
-            handlers = self._observe[key]
-            # Before handlers
-            for handler in handlers[self.BEFORE_CHANGE]:
-                handler(self, key, old, value)
-            # Set the attribute
-            super().__setattr__(key, value)
-            # After handlers
-            for handler in handlers[self.AFTER_CHANGE]:
-                handler(self, key, old, value)
-            # Triggers
-            for check, handler in handlers[self.TRIGGER].items():
+
+def sprite_column(sprites, attribute):
+    """
+    Returns the attribute of every sprite as an array. When the sprites are
+    an `arcade.SpriteList` that has been drawn, values are copied from its
+    buffers, otherwise they're read from every sprite.
+    """
+    buffer = SPRITE_LIST_BUFFERS.get(attribute)
+    if (buffer and isinstance(sprites, arcade.SpriteList)
+            and getattr(sprites, "_vao1", None) is not None):
+        name, dtype, stride, offset = buffer
+        data = np.frombuffer(getattr(sprites, name), dtype=dtype)
+        return data[offset::stride].astype(float)
+    get = operator.attrgetter(attribute)
+    return np.array([get(sprite) for sprite in sprites])
+
+
+class TriggerGroup:
+    """
+    Evaluates a trigger for a whole collection of sprites at once, instead
+    of for every write on every sprite. The handler is called with every
+    sprite the trigger fired for.
+
+    Register `evaluate` as a frame handler to check once per frame, after
+    the animations. Edge, once and debounce state is kept per position in
+    the collection, and is reset whenever the collection changes size.
+    """
+
+    def __init__(self, sprites, trigger, handler):
+        self.sprites = sprites
+        self.trigger = trigger
+        self.handler = handler
+        self.states = {}
+        self._size = None
+
+    def columns(self):
+        return {
+            attribute: sprite_column(self.sprites, attribute)
+            for attribute in self.trigger.attributes
+        }
+
+    def evaluate(self, *args):
+        size = len(self.sprites)
+        if size != self._size:
+            self.states = {}
+            self._size = size
+        if not size:
+            return
+        fired = self.trigger.evaluate(self.columns(), self.states)
+        for idx in np.flatnonzero(fired):
+            self.handler(self.sprites[idx])
+
+
+def _lookup(cls, name):
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+class Observers:
+    """
+    Compact table of the observers of a single attribute. Unused slots share
+    the same empty tuple, so an attribute with only an after_change handler
+    doesn't carry empty containers for the others.
+    """
+
+    __slots__ = ("before", "after", "triggers")
+
+    def __init__(self, before=(), after=(), triggers=()):
+        self.before = before
+        self.after = after
+        self.triggers = triggers
+
+    def add(self, event_type, item):
+        name = self.__slots__[event_type]
+        setattr(self, name, getattr(self, name) + (item, ))
+
+    def remove(self, event_type, item):
+        name = self.__slots__[event_type]
+        setattr(self, name,
+                tuple(other for other in getattr(self, name) if other != item))
+
+    def copy(self):
+        return Observers(self.before, self.after, self.triggers)
+
+
+class ObservedAttribute:
+    """
+    Data descriptor that runs the observers of an attribute around the
+    original attribute, being either a property of the sprite class or a
+    plain instance attribute.
+
+    Class-level observers live on the descriptor itself, instance-level
+    observers in the `_observe` table of the instance, which only exists
+    once an instance has observers of its own.
+    """
+
+    def __init__(self, name, inner=None):
+        self.name = name
+        self.observers = Observers()
+        self.inherited = False
+        if isinstance(inner, ObservedAttribute):
+            # Share the observers of the parent class until this class
+            # declares observers of its own.
+            self.observers = inner.observers
+            self.inherited = True
+            inner = inner.inner
+        self.inner = inner
+        self.is_data = hasattr(type(inner), "__set__")
+
+    def add(self, event_type, item):
+        if self.inherited:
+            self.observers = self.observers.copy()
+            self.inherited = False
+        self.observers.add(event_type, item)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.is_data:
+            return self.inner.__get__(obj, objtype)
+        if self.name in obj.__dict__:
+            return obj.__dict__[self.name]
+        if self.inner is None:
+            raise AttributeError(self.name)
+        if hasattr(type(self.inner), "__get__"):
+            return self.inner.__get__(obj, objtype)
+        return self.inner
+
+    def __set__(self, obj, value):
+        try:
+            old = self.__get__(obj)
+        except AttributeError:
+            old = None
+        instance = None
+        tables = (self.observers, )
+        if obj._observe and self.name in obj._observe:
+            instance = obj._observe[self.name]
+            tables = (self.observers, instance)
+        # Before handlers
+        for table in tables:
+            for handler in table.before:
+                handler(obj, self.name, old, value)
+        # Set the attribute
+        if self.is_data:
+            self.inner.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+        # After handlers
+        for table in tables:
+            for handler in table.after:
+                handler(obj, self.name, old, value)
+        # Triggers, class-level ones are shared and get the sprite passed
+        for check, handler in self.observers.triggers:
+            if check(obj, value):
+                handler(obj)
+        if instance is not None:
+            for check, handler in instance.triggers:
                 if check(value):
                     handler()
+
+    def __delete__(self, obj):
+        if self.is_data:
+            self.inner.__delete__(obj)
         else:
-            super().__setattr__(key, value)
+            del obj.__dict__[self.name]
+
+
+_OBSERVED_CLASSES = {}
+
+
+def observed_class(cls, attributes):
+    """
+    Returns a subclass of `cls` with an `ObservedAttribute` for each of the
+    given attributes. Subclasses are cached, so instances observing the same
+    attributes share the same class.
+    """
+    base = cls.__dict__.get("_observed_base", cls)
+    attributes = frozenset(attributes)
+    key = (base, attributes)
+    if key not in _OBSERVED_CLASSES:
+        dct = {
+            name: ObservedAttribute(name, _lookup(base, name))
+            for name in attributes
+        }
+        dct.update({
+            "_observed_base": base,
+            "_observed_attributes": attributes,
+            "__module__": base.__module__,
+            "__qualname__": base.__qualname__,
+        })
+        _OBSERVED_CLASSES[key] = type(base)(base.__name__, (base, ), dct)
+    return _OBSERVED_CLASSES[key]
+
+
+class ObservableSprite(Sprite):
+    """
+    A sprite allowing handlers to be attached to attribute modifications.
+
+    Instead of intercepting every attribute write, an instance is moved to a
+    subclass with a data descriptor for each observed attribute, the first
+    time that attribute gets observed. Writes to unobserved attributes run at
+    plain `Sprite` speed.
+    """
+
+    BEFORE_CHANGE = 0
+    AFTER_CHANGE = 1
+    TRIGGER = 2
+
+    _observed_attributes = frozenset()
+    _observe = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_observed_base" in cls.__dict__:
+            return
+        for member in list(cls.__dict__.values()):
+            for event_type, target in getattr(member, "_observes", ()):
+                cls._observe_class_member(event_type, target, member)
+
+    def _install_observer(self, attribute):
+        attributes = type(self)._observed_attributes
+        if attribute not in attributes:
+            self.__class__ = observed_class(
+                type(self), attributes | {attribute})
+
+    def _observers(self, attribute):
+        if self._observe is None:
+            self._observe = {}
+        if attribute not in self._observe:
+            self._observe[attribute] = Observers()
+        return self._observe[attribute]
 
     def observe(self, event_type, attribute, handler):
-        self._observe[attribute][event_type].append(handler)
+        self._observers(attribute).add(event_type, handler)
+        self._install_observer(attribute)
+
+    def remove_observer(self, event_type, attribute, handler):
+        if self._observe and attribute in self._observe:
+            self._observe[attribute].remove(event_type, handler)
 
     def before_change(self, attribute, handler):
         self.observe(self.BEFORE_CHANGE, attribute, handler)
@@ -178,20 +612,151 @@ class ObservableSprite(Sprite):
     def after_change(self, attribute, handler):
         self.observe(self.AFTER_CHANGE, attribute, handler)
 
+    def remove_before_change(self, attribute, handler):
+        self.remove_observer(self.BEFORE_CHANGE, attribute, handler)
+
+    def remove_after_change(self, attribute, handler):
+        self.remove_observer(self.AFTER_CHANGE, attribute, handler)
+
     def trigger(self, trigger, handler):
         trigger.bake(self)
-        self._observe[trigger.attribute][self.TRIGGER][trigger.check] = handler
+        for attribute in trigger.attributes:
+            self.observe(self.TRIGGER, attribute, (trigger.check, handler))
+
+    @classmethod
+    def observe_class(cls, event_type, attribute, handler):
+        """
+        Registers an observer for every instance of this class, sharing a
+        single observer table between all of them. Class-level observers
+        should be registered before instances start observing the same
+        attribute themselves.
+        """
+        descriptor = cls.__dict__.get(attribute)
+        if not isinstance(descriptor, ObservedAttribute):
+            descriptor = ObservedAttribute(attribute, _lookup(cls, attribute))
+            setattr(cls, attribute, descriptor)
+            cls._observed_attributes = cls._observed_attributes | {attribute}
+        descriptor.add(event_type, handler)
+
+    @classmethod
+    def _observe_class_member(cls, event_type, target, member):
+        if event_type == cls.TRIGGER:
+            for attribute in target.attributes:
+                cls.observe_class(event_type, attribute,
+                                  (target.compile(), member))
+        else:
+            cls.observe_class(event_type, target, member)
+
+
+def _class_observer(event_type, target):
+    def decorator(fn):
+        fn._observes = getattr(fn, "_observes", ()) + ((event_type, target), )
+        return fn
+
+    return decorator
+
+
+def before_change(attribute):
+    """
+    Declares a method of an `ObservableSprite` subclass as a before_change
+    handler of `attribute`, for every instance of that class.
+    """
+    return _class_observer(ObservableSprite.BEFORE_CHANGE, attribute)
+
+
+def after_change(attribute):
+    """
+    Declares a method of an `ObservableSprite` subclass as an after_change
+    handler of `attribute`, for every instance of that class.
+    """
+    return _class_observer(ObservableSprite.AFTER_CHANGE, attribute)
+
+
+def trigger(trigger):
+    """
+    Declares a method of an `ObservableSprite` subclass as the handler of
+    `trigger`, for every instance of that class.
+    """
+    return _class_observer(ObservableSprite.TRIGGER, trigger)
+
+
+class ChangeBatch:
+    """
+    Collects changes to observed attributes and delivers them in one go when
+    flushed, instead of synchronously on every write. Changes are coalesced
+    per sprite, every attribute keeping the value from before the first
+    change and the value after the last one.
+
+    Every scene has a batch, flushed right before drawing. See
+    `BaseScene.change_phase` to flush at another moment.
+
+    Watched sprites are only weakly referenced, a killed sprite that isn't
+    used anymore is forgotten with it.
+    """
+
+    def __init__(self):
+        self.pending = {}
+        self.handlers = weakref.WeakKeyDictionary()
+
+    def watch(self, sprite, attributes, handler):
+        """
+        Calls handler(sprite, changes) on flush, where changes maps every
+        changed attribute to an (old, new) tuple.
+        """
+        attributes = tuple(attributes)
+        for attribute in attributes:
+            sprite.after_change(attribute, self.record)
+        self.handlers.setdefault(sprite, []).append((handler, attributes))
+
+    def forget(self, sprite):
+        for _, attributes in self.handlers.pop(sprite, ()):
+            for attribute in attributes:
+                sprite.remove_after_change(attribute, self.record)
+        self.pending.pop(sprite, None)
+
+    def record(self, sprite, attribute, old, new):
+        changes = self.pending.get(sprite)
+        if changes is None:
+            changes = self.pending[sprite] = {}
+        if attribute in changes:
+            old = changes[attribute][0]
+        changes[attribute] = (old, new)
+
+    def flush(self, *args):
+        pending, self.pending = self.pending, {}
+        for sprite, changes in pending.items():
+            for handler, attributes in self.handlers.get(sprite, ()):
+                handler_changes = {
+                    attribute: changes[attribute]
+                    for attribute in attributes if attribute in changes
+                }
+                if handler_changes:
+                    handler(sprite, handler_changes)
 
 
 class AnchorPoint:
     def __init__(self, center_x, center_y):
         self._center_x = center_x
         self._center_y = center_y
+        self._angle = 0
+        self._scale = 1
         self.boats = set()
+        self.watchers = []
 
     def dock(self, boat):
         self.boats.add(boat)
 
+    def watch(self, callback):
+        """
+        Call `callback()` whenever the anchor moves, rotates or scales, also
+        when an anchor it is docked to does.
+        """
+        self.watchers.append(callback)
+
+    def _notify(self):
+        for callback in self.watchers:
+            callback()
+
     @property
     def center_x(self):
         return self._center_x
@@ -206,21 +771,95 @@ class AnchorPoint:
 
     @center_x.setter
     def center_x(self, value):
-        offset = value - self._center_x
-        self._center_x = value
-        for boat in self.boats:
-            boat.center_x += offset
+        self.move(value - self._center_x, 0)
 
     @center_y.setter
     def center_y(self, value):
-        offset = value - self._center_y
-        self._center_y = value
-        for boat in self.boats:
-            boat.center_y += offset
+        self.move(0, value - self._center_y)
 
     @position.setter
     def position(self, value):
-        self.center_x, self.center_y = value
+        x, y = value
+        self.move(x - self._center_x, y - self._center_y)
+
+    def move(self, dx, dy):
+        """
+        Moves the anchor and everything docked to it in a single pass, with
+        one position write per docked sprite.
+        """
+        if not dx and not dy:
+            return
+        self._center_x += dx
+        self._center_y += dy
+        self._notify()
+        for boat in self.boats:
+            if isinstance(boat, AnchorPoint):
+                boat.move(dx, dy)
+            else:
+                x, y = boat.position
+                _place(boat, x + dx, y + dy)
+
+    @property
+    def angle(self):
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        self.transform(angle=value - self._angle)
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self.transform(scale=value / self._scale)
+
+    def rotate(self, angle):
+        self.transform(angle=angle)
+
+    def transform(self, angle=0, scale=1):
+        """
+        Rotates the anchor by `angle` degrees and multiplies its scale by
+        `scale`. Everything docked to it is rotated and scaled around the
+        anchor in one batched pass.
+        """
+        if not angle and scale == 1:
+            return
+        self._angle += angle
+        self._scale *= scale
+        self._notify()
+        anchors, sprites = self._docked()
+        if not anchors and not sprites:
+            return
+        rad = math.radians(angle)
+        cos, sin = math.cos(rad) * scale, math.sin(rad) * scale
+        center = np.array(self.position, dtype=float)
+        points = np.array([boat.position for boat in anchors + sprites],
+                          dtype=float)
+        points = (points - center) @ np.array([[cos, sin], [-sin, cos]])
+        points = (points + center).tolist()
+        for anchor, (x, y) in zip(anchors, points):
+            anchor._center_x, anchor._center_y = x, y
+            anchor._angle += angle
+            anchor._scale *= scale
+            anchor._notify()
+        for sprite, (x, y) in zip(sprites, points[len(anchors):]):
+            _place(sprite, x, y)
+            sprite.angle += angle
+            sprite.scale *= scale
+
+    def _docked(self):
+        anchors, sprites = [], []
+        pending = [self]
+        while pending:
+            for boat in pending.pop().boats:
+                if isinstance(boat, AnchorPoint):
+                    anchors.append(boat)
+                    pending.append(boat)
+                else:
+                    sprites.append(boat)
+        return anchors, sprites
 
     @classmethod
     def from_sprite(cls, sprite, orientation):
@@ -229,28 +868,168 @@ class AnchorPoint:
         return anchor
 
 
+class Viewport:
+    """
+    The area of a window widgets are laid out in. There's one viewport per
+    window, its bounds are cached and only updated when the window is
+    resized.
+    """
+
+    _viewports = weakref.WeakKeyDictionary()
+
+    def __init__(self, width, height):
+        self.resize(width, height)
+
+    @classmethod
+    def of(cls, window):
+        viewport = cls._viewports.get(window)
+        if viewport is None:
+            viewport = cls(window.width, window.height)
+            window.push_handlers(on_resize=viewport.resize)
+            cls._viewports[window] = viewport
+        return viewport
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.bounds = (0, 0, width, height)
+
+
+def sprite_bounds(sprite):
+    try:
+        points = sprite.get_adjusted_hit_box()
+    except ValueError:
+        # a sprite without texture or size is just a point
+        x, y = sprite.position
+        return (x, y, x, y)
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def invalidates_bounds(method):
+    @wraps(method)
+    def invalidating(self, sprite, *args, **kwargs):
+        method(self, sprite, *args, **kwargs)
+        self.widget.invalidate_bounds(sprite)
+
+    return invalidating
+
+
+def changes_tree(method):
+    @wraps(method)
+    def changing(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.widget.tree_changed()
+        return result
+
+    return changing
+
+
+class WidgetSpriteList(arcade.SpriteList):
+    """
+    Spritelist of a widget, invalidating the widget's cached bounds whenever
+    one of its sprites is added, removed, moved, rotated or resized.
+    """
+
+    def __init__(self, widget, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.widget = widget
+
+    @changes_tree
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.widget.invalidate_bounds(item)
+
+    append = changes_tree(invalidates_bounds(arcade.SpriteList.append))
+    remove = changes_tree(invalidates_bounds(arcade.SpriteList.remove))
+    update_location = invalidates_bounds(arcade.SpriteList.update_location)
+    update_size = invalidates_bounds(arcade.SpriteList.update_size)
+    update_width = invalidates_bounds(arcade.SpriteList.update_width)
+    update_height = invalidates_bounds(arcade.SpriteList.update_height)
+    update_angle = invalidates_bounds(arcade.SpriteList.update_angle)
+    update_texture = invalidates_bounds(arcade.SpriteList.update_texture)
+
+
+class WidgetChildren(list):
+    """
+    The widgets nested in a widget, telling the widget when they change.
+    """
+
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+
+    append = changes_tree(list.append)
+    extend = changes_tree(list.extend)
+    insert = changes_tree(list.insert)
+    remove = changes_tree(list.remove)
+    pop = changes_tree(list.pop)
+    clear = changes_tree(list.clear)
+
+
 class Widget(PositionHelperMixin):
+    # lay out relative to the parent widget instead of the window
+    layout_in_parent = False
+
     def __init__(self, x, y, width, height, *args, **kwargs):
-        self.spritelist = arcade.SpriteList()
-        self.anchor = AnchorPoint(center_x=0, center_y=0)
-        self.showing = True
+        self._bounds = None
+        self._sprite_bounds = {}
+        self.parent_widget = None
+        self.tree_version = 0
+        self.children = WidgetChildren(self)
+        self.spritelist = WidgetSpriteList(self)
+        self._viewport = None
+        self._container = None
         self.parent_widget = CURRENT_WIDGET.get(None)
+        self.graph = CURRENT_GRAPH.get(None)
+        if self.graph is None and self.parent_widget:
+            self.graph = self.parent_widget.graph
+        if self.graph is not None:
+            self.anchor = self.graph.add_node()
+        else:
+            self.anchor = AnchorPoint(center_x=0, center_y=0)
+        self.showing = True
+        self.layout = None
         self.width = width
         self.height = height
 
         token = CURRENT_WIDGET.set(self)
         self.setup(*args, **kwargs)
         CURRENT_WIDGET.reset(token)
+        if self.layout is not None:
+            self.layout.apply()
 
         if self.parent_widget:
+            self.parent_widget.children.append(self)
+            self.parent_widget.invalidate_bounds()
             self.parent_widget.anchor.dock(self.anchor)
         for sprite in self.spritelist:
             self.anchor.dock(sprite)
+        self.anchor.watch(self.invalidate_bounds)
         self.position = (x, y)
 
     def setup(self, *args, **kwargs):
         raise NotImplementedError()
 
+    def relayout(self):
+        """
+        Apply the widget's layout again, only the parts of it that were
+        invalidated are recalculated.
+        """
+        if self.layout is not None:
+            self.update_graph()
+            self.layout.apply(*self.position, docked=True)
+
+    def update_graph(self):
+        """
+        Write pending scene graph transforms to the sprites. Sprites placed at
+        absolute positions should be placed after this, otherwise the graph
+        takes the placement for an outside move and adds its own on top.
+        """
+        if self.graph is not None:
+            self.graph.update()
+
     def show(self):
         self.showing = True
 
@@ -267,7 +1046,23 @@ class Widget(PositionHelperMixin):
 
     @position.setter
     def position(self, value):
-        self.center_x, self.center_y = value
+        self.anchor.position = value
+
+    @property
+    def angle(self):
+        return self.anchor.angle
+
+    @angle.setter
+    def angle(self, value):
+        self.anchor.angle = value
+
+    @property
+    def scale(self):
+        return self.anchor.scale
+
+    @scale.setter
+    def scale(self, value):
+        self.anchor.scale = value
 
     @property
     def center_x(self):
@@ -285,43 +1080,208 @@ class Widget(PositionHelperMixin):
     def center_y(self, value):
         self.anchor.center_y = value
 
+    @property
+    def viewport(self):
+        if self._viewport is None:
+            self._viewport = Viewport.of(arcade.get_window())
+        return self._viewport
+
+    @property
+    def container(self):
+        """
+        The viewport or widget `left`, `right`, `top` and `bottom` are
+        relative to.
+        """
+        if self._container is not None:
+            return self._container
+        if self.layout_in_parent and self.parent_widget:
+            return self.parent_widget
+        return self.viewport
+
+    @container.setter
+    def container(self, value):
+        self._container = value
+
+    @property
+    def width(self):
+        if self._width is None:
+            left, _, right, _ = self.content_bounds
+            return right - left
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._width = value
+
+    @property
+    def height(self):
+        if self._height is None:
+            _, bottom, _, top = self.content_bounds
+            return top - bottom
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._height = value
+
+    @property
+    def bounds(self):
+        """
+        `(left, bottom, right, top)` of the widget. Widgets without a width
+        or height are as large as their content.
+        """
+        if self._width is None or self._height is None:
+            return self.content_bounds
+        x, y = self.anchor.position
+        half_width, half_height = self._width / 2, self._height / 2
+        return (x - half_width, y - half_height, x + half_width,
+                y + half_height)
+
+    @property
+    def content_bounds(self):
+        """
+        The bounding box of the widget's sprites and nested widgets. It's
+        cached, and only recalculated after one of them changed.
+        """
+        if self._bounds is None:
+            boxes = []
+            for sprite in self.spritelist:
+                box = self._sprite_bounds.get(sprite)
+                if box is None:
+                    box = self._sprite_bounds[sprite] = sprite_bounds(sprite)
+                boxes.append(box)
+            boxes.extend(child.bounds for child in self.children)
+            if not boxes:
+                x, y = self.anchor.position
+                return (x, y, x, y)
+            lefts, bottoms, rights, tops = zip(*boxes)
+            self._bounds = (min(lefts), min(bottoms), max(rights), max(tops))
+        return self._bounds
+
+    def invalidate_bounds(self, sprite=None):
+        """
+        Drop the cached bounds of this widget and of every widget it is
+        nested in. Fixed size widgets don't cache their own bounds, but their
+        parents can, so this always climbs up to the outermost widget.
+        """
+        if sprite is not None:
+            self._sprite_bounds.pop(sprite, None)
+        widget = self
+        while widget is not None:
+            widget._bounds = None
+            widget = widget.parent_widget
+
+    def tree_changed(self):
+        """
+        Count a change to the sprites or nested widgets of this widget, and of
+        every widget it is nested in, in their `tree_version`.
+        """
+        widget = self
+        while widget is not None:
+            widget.tree_version += 1
+            widget = widget.parent_widget
+
+    def collides_with_point(self, point):
+        x, y = point
+        left, bottom, right, top = self.bounds
+        return left <= x <= right and bottom <= y <= top
+
     @property
     def left(self):
-        return int(self.anchor.center_x - (self.width / 2))
+        return int(self.bounds[0] - self.container.bounds[0])
 
     @left.setter
     def left(self, value):
-        offset = value + (self.width / 2)
-        self.anchor.center_x = offset
+        self.anchor.center_x += value - self.bounds[0] + \
+            self.container.bounds[0]
 
     @property
     def right(self):
-        x = self.anchor.center_x + (self.width / 2)
-        return int(arcade.get_window().width - x)
+        return int(self.container.bounds[2] - self.bounds[2])
 
     @right.setter
     def right(self, value):
-        offset = arcade.get_window().width - value
-        self.anchor.center_x = offset - (self.width / 2)
+        self.anchor.center_x += self.container.bounds[2] - value - \
+            self.bounds[2]
 
     @property
     def top(self):
-        y = self.anchor.center_y + (self.height / 2)
-        return int(arcade.get_window().height - y)
+        return int(self.container.bounds[3] - self.bounds[3])
 
     @top.setter
     def top(self, value):
-        offset = arcade.get_window().height - value
-        self.anchor.center_y = offset - (self.height / 2)
+        self.anchor.center_y += self.container.bounds[3] - value - \
+            self.bounds[3]
 
     @property
     def bottom(self):
-        return int(self.anchor.center_y - (self.height / 2))
+        return int(self.bounds[1] - self.container.bounds[1])
 
     @bottom.setter
     def bottom(self, value):
-        offset = value + (self.height / 2)
-        self.anchor.center_y = offset
+        self.anchor.center_y += value - self.bounds[1] + \
+            self.container.bounds[1]
+
+
+class WidgetBatch:
+    """
+    Draws widgets, and the widgets nested in them, from a single spritelist.
+    Hidden widgets, and their nested widgets, are skipped and widgets outside
+    of the viewport are culled by their bounds. The spritelist is only
+    rebuilt when the visible widgets or their sprites change.
+
+    A scene picks up a batch assigned to one of its attributes, like it does
+    for spritelists.
+    """
+
+    def __init__(self, widgets=(), viewport=None):
+        self.widgets = list(widgets)
+        self._viewport = viewport
+        self.spritelist = arcade.SpriteList(use_spatial_hash=False)
+        self._signature = None
+
+    @property
+    def viewport(self):
+        if self._viewport is None:
+            self._viewport = Viewport.of(arcade.get_window())
+        return self._viewport
+
+    def add(self, widget):
+        self.widgets.append(widget)
+
+    def remove(self, widget):
+        self.widgets.remove(widget)
+
+    def visible_widgets(self):
+        left, bottom, right, top = self.viewport.bounds
+        visible = []
+        pending = self.widgets[::-1]
+        while pending:
+            widget = pending.pop()
+            if not widget.showing:
+                continue
+            w_left, w_bottom, w_right, w_top = widget.bounds
+            if (w_right >= left and w_left <= right and w_top >= bottom
+                    and w_bottom <= top):
+                visible.append(widget)
+            pending.extend(widget.children[::-1])
+        return visible
+
+    def draw(self, **kwargs):
+        visible = self.visible_widgets()
+        signature = [(widget, widget.tree_version) for widget in visible]
+        if signature != self._signature:
+            self._signature = signature
+            self._rebuild(visible)
+        self.spritelist.draw(**kwargs)
+
+    def _rebuild(self, widgets):
+        previous = self.spritelist
+        for sprite in previous:
+            sprite.sprite_lists.remove(previous)
+        self.spritelist = arcade.SpriteList(use_spatial_hash=False)
+        for widget in widgets:
+            self.spritelist.extend(widget.spritelist)
 
 
 # class Widget(PositionHelperMixin):
@@ -0,0 +1,250 @@
+import math
+
+EDGES = {
+    "center": (0, 0),
+    "left": (-1, 0),
+    "right": (1, 0),
+    "top": (0, 1),
+    "bottom": (0, -1),
+    "topleft": (-1, 1),
+    "topright": (1, 1),
+    "bottomleft": (-1, -1),
+    "bottomright": (1, -1),
+}
+
+
+class Layout:
+    """
+    Positions its items, sprites, widgets or other layouts, around a center
+    point. Measured sizes are cached per item, and a layout is only applied
+    again when it was invalidated, by adding or removing items or by calling
+    `invalidate` when an item changed size. Invalidating a nested layout
+    invalidates its parents, but leaves its siblings untouched.
+    """
+
+    def __init__(self, *items, spacing=0, padding=0):
+        self.items = []
+        self.spacing = spacing
+        self.padding = padding
+        self.parent = None
+        self.dirty = True
+        self._size = None
+        self._sizes = {}
+        self._origin = None
+        self._offset = None
+        for item in items:
+            self.add(item)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, item):
+        if isinstance(item, Layout):
+            item.parent = self
+        self.items.append(item)
+        self.invalidate()
+        return item
+
+    def remove(self, item):
+        self.items.remove(item)
+        self._sizes.pop(item, None)
+        self.invalidate()
+
+    def invalidate(self, item=None):
+        """
+        Mark this layout, and the layouts it is part of, to be applied again.
+        Pass an item to have its size measured again.
+        """
+        if item is not None:
+            self._sizes.pop(item, None)
+        layout = self
+        while layout is not None:
+            layout.dirty = True
+            layout._size = None
+            if layout.parent is not None:
+                layout.parent._sizes.pop(layout, None)
+            layout = layout.parent
+
+    def item_size(self, item):
+        size = self._sizes.get(item)
+        if size is None:
+            if isinstance(item, Layout):
+                size = item.measure()
+            else:
+                size = (item.width, item.height)
+            self._sizes[item] = size
+        return size
+
+    def measure(self):
+        if self._size is None:
+            width, height = self._measure(
+                [self.item_size(item) for item in self.items])
+            self._size = (width + self.padding * 2,
+                          height + self.padding * 2)
+        return self._size
+
+    def apply(self, x=0, y=0, docked=False):
+        """
+        Position the items around (x, y). With `docked`, the items are docked
+        to an anchor at (x, y) and already followed its moves, so only
+        invalidated layouts are applied.
+        """
+        self._apply(x, y, (0, 0), docked)
+
+    def _apply(self, x, y, offset, docked):
+        if (not self.dirty and offset == self._offset
+                and (docked or (x, y) == self._origin)):
+            return
+        width, height = self.measure()
+        sizes = [self.item_size(item) for item in self.items]
+        offsets = self._arrange(sizes, width - self.padding * 2,
+                                height - self.padding * 2)
+        for item, (dx, dy) in zip(self.items, offsets):
+            if isinstance(item, Layout):
+                item._apply(x + dx, y + dy, (dx, dy), docked)
+            else:
+                item.position = (x + dx, y + dy)
+        self._origin = (x, y)
+        self._offset = offset
+        self.dirty = False
+
+    def _measure(self, sizes):
+        raise NotImplementedError()
+
+    def _arrange(self, sizes, width, height):
+        raise NotImplementedError()
+
+
+class Stack(Layout):
+    """
+    Lines items up next to each other. Items are aligned to the `start`,
+    `center` or `end` of the stack's cross axis.
+    """
+
+    horizontal = True
+
+    def __init__(self, *items, spacing=0, padding=0, align="center"):
+        self.align = align
+        super().__init__(*items, spacing=spacing, padding=padding)
+
+    def _measure(self, sizes):
+        if not sizes:
+            return 0, 0
+        main, cross = (0, 1) if self.horizontal else (1, 0)
+        length = sum(size[main] for size in sizes)
+        length += self.spacing * (len(sizes) - 1)
+        thickness = max(size[cross] for size in sizes)
+        if self.horizontal:
+            return length, thickness
+        return thickness, length
+
+    def _arrange(self, sizes, width, height):
+        align = {"start": -1, "center": 0, "end": 1}[self.align]
+        offsets = []
+        if self.horizontal:
+            position = -width / 2
+            for item_width, item_height in sizes:
+                y = align * (height - item_height) / 2
+                offsets.append((position + item_width / 2, y))
+                position += item_width + self.spacing
+        else:
+            position = height / 2
+            for item_width, item_height in sizes:
+                x = align * (width - item_width) / 2
+                offsets.append((x, position - item_height / 2))
+                position -= item_height + self.spacing
+        return offsets
+
+
+class Row(Stack):
+    """
+    Stacks items from left to right.
+    """
+
+    horizontal = True
+
+
+class Column(Stack):
+    """
+    Stacks items from top to bottom.
+    """
+
+    horizontal = False
+
+
+class Grid(Layout):
+    """
+    Places items in equally sized cells, from left to right and top to
+    bottom. Cells are as large as the largest item.
+    """
+
+    def __init__(self, *items, columns=1, spacing=0, padding=0):
+        self.columns = columns
+        super().__init__(*items, spacing=spacing, padding=padding)
+
+    def _cell(self, sizes):
+        return (max(size[0] for size in sizes), max(size[1] for size in sizes))
+
+    def _measure(self, sizes):
+        if not sizes:
+            return 0, 0
+        cell_width, cell_height = self._cell(sizes)
+        columns = min(self.columns, len(sizes))
+        rows = math.ceil(len(sizes) / self.columns)
+        return (columns * cell_width + (columns - 1) * self.spacing,
+                rows * cell_height + (rows - 1) * self.spacing)
+
+    def _arrange(self, sizes, width, height):
+        if not sizes:
+            return []
+        cell_width, cell_height = self._cell(sizes)
+        offsets = []
+        for idx in range(len(sizes)):
+            row, column = divmod(idx, self.columns)
+            x = -width / 2 + column * (cell_width + self.spacing)
+            y = height / 2 - row * (cell_height + self.spacing)
+            offsets.append((x + cell_width / 2, y - cell_height / 2))
+        return offsets
+
+
+class EdgeLayout(Layout):
+    """
+    Pins items to an edge or corner of a box of a fixed size, at a margin
+    from that edge.
+    """
+
+    def __init__(self, width, height, padding=0):
+        self.width = width
+        self.height = height
+        self.constraints = {}
+        super().__init__(padding=padding)
+
+    def add(self, item, edge="center", margin=0):
+        if edge not in EDGES:
+            raise ValueError("Unknown edge {}".format(edge))
+        self.constraints[item] = (edge, margin)
+        return super().add(item)
+
+    def remove(self, item):
+        super().remove(item)
+        del self.constraints[item]
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.invalidate()
+
+    def _measure(self, sizes):
+        return (self.width - self.padding * 2, self.height - self.padding * 2)
+
+    def _arrange(self, sizes, width, height):
+        offsets = []
+        for item, (item_width, item_height) in zip(self.items, sizes):
+            edge, margin = self.constraints[item]
+            x, y = EDGES[edge]
+            offsets.append((x * ((width - item_width) / 2 - margin),
+                            y * ((height - item_height) / 2 - margin)))
+        return offsets
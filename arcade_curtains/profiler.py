@@ -0,0 +1,199 @@
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from time import perf_counter
+import sys
+import warnings
+
+import arcade
+import attr
+import numpy as np
+
+from .animation import AnimationManager
+
+PHASES = ("update", "animations", "events", "draw")
+
+
+def handler_name(handler):
+    handler = getattr(handler, "func", handler)
+    name = getattr(handler, "__qualname__", None)
+    if name is None:
+        return repr(handler)
+    return name
+
+
+class SlowHandlerWarning(UserWarning):
+    pass
+
+
+@attr.s
+class HandlerStats:
+    calls = attr.ib(default=0)
+    total_time = attr.ib(default=0)
+    max_time = attr.ib(default=0)
+    allocations = attr.ib(default=0)
+    frame_time = attr.ib(default=0)
+    slow_frames = attr.ib(default=0)
+
+    @property
+    def mean_time(self):
+        if not self.calls:
+            return 0
+        return self.total_time / self.calls
+
+
+class HandlerProfiler:
+    """
+    Measures wall time, call count and allocated memory blocks of every
+    handler, per event group and event type. Allocations are the net amount
+    of memory blocks a handler leaves allocated, as reported by
+    `sys.getallocatedblocks`.
+
+    A frame ends when `end_frame` is called, which Curtains does after every
+    draw. Handlers that took longer than `budget` seconds within a single
+    frame are flagged, and a `SlowHandlerWarning` is issued the first time it
+    happens.
+    """
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.frame_count = 0
+        self.stats = defaultdict(HandlerStats)
+        self.slow_handlers = set()
+        self._frame_stats = set()
+
+    def run_handlers(self, group, event_type, handlers, *args, **kwargs):
+        for handler, handler_args, handler_kwargs in handlers:
+            args = (*args, *handler_args)
+            kwargs.update(handler_kwargs)
+            blocks = sys.getallocatedblocks()
+            start = perf_counter()
+            handler(*args, **kwargs)
+            duration = perf_counter() - start
+            allocations = sys.getallocatedblocks() - blocks
+            self.record_handler(group, event_type, handler, duration,
+                                allocations)
+
+    def record_handler(self, group, event_type, handler, duration,
+                       allocations=0):
+        key = (group.name, event_type, handler_name(handler))
+        stats = self.stats[key]
+        stats.calls += 1
+        stats.total_time += duration
+        stats.max_time = max(stats.max_time, duration)
+        stats.allocations += allocations
+        stats.frame_time += duration
+        self._frame_stats.add(key)
+
+    def end_frame(self):
+        for key in self._frame_stats:
+            stats = self.stats[key]
+            if self.budget is not None and stats.frame_time > self.budget:
+                self._flag(key, stats)
+            stats.frame_time = 0
+        self._frame_stats.clear()
+        self.frame_count += 1
+
+    def _flag(self, key, stats):
+        stats.slow_frames += 1
+        if key in self.slow_handlers:
+            return
+        self.slow_handlers.add(key)
+        group, event_type, name = key
+        msg = "{} handling {} in group {} took {:.2f}ms, over the {:.2f}ms budget"
+        warnings.warn(
+            msg.format(name, event_type, group, stats.frame_time * 1000,
+                       self.budget * 1000), SlowHandlerWarning)
+
+    @property
+    def handler_costs(self):
+        costs = defaultdict(float)
+        for (group, event_type, name), stats in self.stats.items():
+            costs[name] += stats.total_time
+        return costs
+
+    def top_handlers(self, count=10):
+        costs = sorted(
+            self.handler_costs.items(), key=lambda item: item[1], reverse=True)
+        return costs[:count]
+
+    def reset(self):
+        self.stats.clear()
+        self.slow_handlers.clear()
+        self._frame_stats.clear()
+        self.frame_count = 0
+
+
+class FrameProfiler(HandlerProfiler):
+    """
+    Records how long every phase of a frame takes, on top of the handler
+    statistics. Only the last `window` frames are kept to calculate
+    percentiles.
+
+    Frame handlers are timed as part of the update phase, except for the
+    animation managers, which are accounted for in the animations phase.
+    """
+
+    def __init__(self, window=120, overlay=False, budget=None):
+        super().__init__(budget=budget)
+        self.window = window
+        self.overlay = overlay
+        self.phases = {phase: deque(maxlen=window) for phase in PHASES}
+        self._current = dict.fromkeys(PHASES, 0)
+
+    @contextmanager
+    def phase(self, phase):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._current[phase] += perf_counter() - start
+
+    def record_handler(self, group, event_type, handler, duration,
+                       allocations=0):
+        super().record_handler(group, event_type, handler, duration,
+                               allocations)
+        if isinstance(getattr(handler, "__self__", None), AnimationManager):
+            self._current["animations"] += duration
+
+    def end_frame(self):
+        current = self._current
+        current["update"] = max(current["update"] - current["animations"], 0)
+        for phase, duration in current.items():
+            self.phases[phase].append(duration)
+            current[phase] = 0
+        super().end_frame()
+
+    def last_frame(self):
+        return {
+            phase: samples[-1] if samples else 0
+            for phase, samples in self.phases.items()
+        }
+
+    def percentile(self, phase, q):
+        samples = self.phases[phase]
+        if not samples:
+            return 0
+        return float(np.percentile(samples, q))
+
+    def summary(self, percentiles=(50, 90, 99)):
+        return {
+            phase: {"p{}".format(q): self.percentile(phase, q)
+                    for q in percentiles}
+            for phase in PHASES
+        }
+
+    def reset(self):
+        super().reset()
+        for samples in self.phases.values():
+            samples.clear()
+        self._current = dict.fromkeys(PHASES, 0)
+
+    def draw_overlay(self, x, y, color=arcade.color.WHITE, font_size=10):
+        lines = ["{:<10} p50 {:6.2f}ms  p99 {:6.2f}ms".format(
+            phase, self.percentile(phase, 50) * 1000,
+            self.percentile(phase, 99) * 1000) for phase in PHASES]
+        for name, cost in self.top_handlers(5):
+            lines.append("{:<30} {:8.2f}ms".format(name[-30:], cost * 1000))
+        for idx, line in enumerate(lines):
+            arcade.draw_text(
+                line, x, y - (idx * (font_size + 4)), color, font_size)
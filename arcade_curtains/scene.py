@@ -1,25 +1,198 @@
 import arcade
 
-from .event import EventHandler
+from .event import Event, EventHandler
 from .animation import AnimationManager
+from .chunks import ChunkedSpriteList
+from .graph import SceneGraph
+from .helpers import ChangeBatch, Widget, WidgetBatch
+
+DRAWABLES = (arcade.SpriteList, WidgetBatch, ChunkedSpriteList)
+
+
+class Layer:
+    def __init__(self, drawable, z, order, visible):
+        self.drawable = drawable
+        self.z = z
+        self.order = order
+        self.visible = visible
+
+
+class RenderLayers:
+    """
+    Ordered registry of what a scene draws. Layers are drawn from low to high
+    z, and in the order they were added within the same z. A layer is a
+    spritelist, a chunked spritelist, a widget batch or a widget, which is
+    drawn with the widgets nested in it.
+
+    The drawables of the visible layers are kept in order in `drawables`,
+    which is only rebuilt when a layer is added, removed, moved, shown or
+    hidden.
+    """
+
+    def __init__(self):
+        self.layers = {}
+        self.drawables = []
+        self._order = 0
+
+    def __contains__(self, item):
+        return item in self.layers
+
+    def __len__(self):
+        return len(self.layers)
+
+    def __iter__(self):
+        return iter(self._sorted())
+
+    def add(self, item, z=0, visible=True):
+        if item in self.layers:
+            raise ValueError("{} is already a layer".format(item))
+        drawable = item
+        if isinstance(item, Widget):
+            drawable = WidgetBatch([item])
+        self.layers[item] = Layer(drawable, z, self._next_order(), visible)
+        self._rebuild()
+        return item
+
+    def remove(self, item):
+        del self.layers[item]
+        self._rebuild()
+
+    def replace(self, item, new_item):
+        """
+        Put another spritelist, batch or widget in the place of a layer.
+        """
+        layer = self.layers.pop(item)
+        self.add(new_item, layer.z, layer.visible)
+        self.layers[new_item].order = layer.order
+        self._rebuild()
+
+    def set_z(self, item, z):
+        """
+        Move a layer to another z, on top of the layers already there.
+        """
+        layer = self.layers[item]
+        layer.z = z
+        layer.order = self._next_order()
+        self._rebuild()
+
+    def z_of(self, item):
+        return self.layers[item].z
+
+    def show(self, item):
+        self.layers[item].visible = True
+        self._rebuild()
+
+    def hide(self, item):
+        self.layers[item].visible = False
+        self._rebuild()
+
+    def is_visible(self, item):
+        return self.layers[item].visible
+
+    def _next_order(self):
+        self._order += 1
+        return self._order
+
+    def _sorted(self):
+        return sorted(self.layers,
+                      key=lambda item: (self.layers[item].z,
+                                        self.layers[item].order))
+
+    def _rebuild(self):
+        self.drawables[:] = [
+            self.layers[item].drawable for item in self._sorted()
+            if self.layers[item].visible
+        ]
 
 
 class BaseScene:
+    change_phase = Event.BEFORE_DRAW
+
     def __init__(self, *args, **kwargs):
+        self.layers = RenderLayers()
+        # spritelists assigned before BaseScene.__init__ was called
+        for value in list(self.__dict__.values()):
+            if isinstance(value, DRAWABLES) and value not in self.layers:
+                self.layers.add(value)
         self.window = None
         self.curtains = None
+        self.time_scale = 1
+        self.paused = False
         self.animations = AnimationManager()
         self.events = EventHandler()
         self.events.frame(self.animations._blip)
-        self._sprite_lists = []
+        self.graph = SceneGraph()
+        self.events.add_event(Event.BEFORE_DRAW, self.graph.update)
+        self.changes = ChangeBatch()
+        self.events.add_event(self.change_phase, self.changes.flush)
         self.setup(*args, **kwargs)
-        self._setup_spritelists()
+
+    def __setattr__(self, name, value):
+        previous = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        if "layers" not in self.__dict__:
+            # picked up once the layers exist
+            return
+        if isinstance(value, DRAWABLES) or isinstance(previous, DRAWABLES):
+            self._track_layer(previous, value)
+
+    def __delattr__(self, name):
+        previous = self.__dict__.get(name)
+        super().__delattr__(name)
+        if "layers" in self.__dict__ and isinstance(previous, DRAWABLES):
+            self._track_layer(previous, None)
+
+    @property
+    def _sprite_lists(self):
+        """
+        The drawables of the visible layers, in drawing order. Read-only, add
+        and remove drawables through `layers`.
+        """
+        return tuple(self.layers.drawables)
+
+    def _track_layer(self, previous, value):
+        """
+        Spritelists and widget batches assigned to a scene attribute are
+        drawn, in the order they were assigned, until they are no longer
+        assigned to any attribute.
+        """
+        if previous is value:
+            return
+        if (isinstance(previous, DRAWABLES) and previous in self.layers
+                and not self._is_assigned(previous)):
+            if isinstance(value, DRAWABLES) and value not in self.layers:
+                self.layers.replace(previous, value)
+                return
+            self.layers.remove(previous)
+        if isinstance(value, DRAWABLES) and value not in self.layers:
+            self.layers.add(value)
+
+    def _is_assigned(self, drawable):
+        return any(value is drawable for value in self.__dict__.values())
 
     def _bind(self, window, curtains):
         self.window = window
         self.curtains = curtains
         self.draw_kwargs = curtains.options.draw_kwargs
 
+    def _update(self, delta_time):
+        if self.paused:
+            return
+        self.events.trigger_frame(delta_time * self.time_scale)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def step(self, delta_time=1 / 60):
+        """
+        Run a single frame of this scene, regardless of the scene being
+        paused.
+        """
+        self.events.trigger_frame(delta_time * self.time_scale)
+
     def setup(self, *args, **kwargs):
         raise NotImplementedError()
 
@@ -29,11 +202,6 @@ class BaseScene:
     def enter_scene(self, previous_scene):
         pass
 
-    def _setup_spritelists(self):
-        for attribute, value in self.__dict__.items():
-            if isinstance(value, arcade.SpriteList):
-                self._sprite_lists.append(value)
-
     def draw(self):
-        for slist in self._sprite_lists:
-            slist.draw(**self.draw_kwargs)
+        for drawable in self.layers.drawables:
+            drawable.draw(**self.draw_kwargs)
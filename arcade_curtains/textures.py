@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from functools import lru_cache, partial
+
+import arcade
+from PIL import Image, ImageDraw, ImageFont
+
+DEFAULT_FONT = ("calibri", "arial")
+
+
+class TextureCache:
+    """
+    Least recently used cache of generated textures, keyed by the parameters
+    they were generated from. Textures are only generated on a cache miss.
+
+    Besides the amount of textures, the memory their images take up can be
+    capped with `maxbytes`. Evicted textures keep working for the sprites
+    still using them, they are just generated again when asked for.
+    """
+
+    def __init__(self, maxsize=512, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.textures = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.textures)
+
+    def __contains__(self, key):
+        return key in self.textures
+
+    def get(self, key, factory):
+        texture = self.textures.get(key)
+        if texture is not None:
+            self.hits += 1
+            self.textures.move_to_end(key)
+            return texture
+        self.misses += 1
+        texture = self.textures[key] = factory()
+        self.nbytes += texture_nbytes(texture)
+        while len(self.textures) > 1 and self._full():
+            _, evicted = self.textures.popitem(last=False)
+            self.nbytes -= texture_nbytes(evicted)
+        return texture
+
+    def _full(self):
+        if len(self.textures) > self.maxsize:
+            return True
+        return self.maxbytes is not None and self.nbytes > self.maxbytes
+
+    def clear(self):
+        self.textures.clear()
+        self.nbytes = 0
+        self.hits = self.misses = 0
+
+
+def texture_nbytes(texture):
+    image = getattr(texture, "image", None)
+    if image is None:
+        return 0
+    return image.width * image.height * len(image.getbands())
+
+
+TEXTURES = TextureCache(maxsize=1024, maxbytes=64 * 1024 * 1024)
+TEXT_TEXTURES = TextureCache(maxsize=1024)
+
+
+@lru_cache(maxsize=64)
+def load_font(font_name, font_size):
+    if isinstance(font_name, str):
+        font_name = (font_name, )
+    for name in font_name:
+        for filename in (name, "{}.ttf".format(name)):
+            try:
+                return ImageFont.truetype(filename, font_size)
+            except OSError:
+                continue
+    return ImageFont.load_default()
+
+
+def render_text(text, font_name, font_size, color):
+    font = load_font(font_name, font_size)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    left, top, right, bottom = draw.multiline_textbbox((0, 0), text,
+                                                       font=font)
+    size = (max(right - left, 1), max(bottom - top, 1))
+    image = Image.new("RGBA", size, (0, 0, 0, 0))
+    ImageDraw.Draw(image).multiline_text((-left, -top), text, font=font,
+                                         fill=tuple(color))
+    name = "text:{}:{}:{}:{}".format(font_name, font_size, tuple(color), text)
+    return arcade.Texture(name, image)
+
+
+def text_texture(text, font_name=DEFAULT_FONT, font_size=12,
+                 color=arcade.color.WHITE):
+    """
+    Texture of rendered text, shared with every other text of the same font,
+    size and color.
+    """
+    key = (font_name, font_size, text, tuple(color))
+    return TEXT_TEXTURES.get(
+        key, partial(render_text, text, font_name, font_size, color))
+
+
+def soft_circle_texture(diameter, color, center_alpha=255, outer_alpha=0):
+    """
+    Shared version of `arcade.make_soft_circle_texture`.
+    """
+    color = tuple(color)
+    key = ("soft_circle", diameter, color, center_alpha, outer_alpha)
+    return TEXTURES.get(key, partial(arcade.make_soft_circle_texture,
+                                     diameter, color, center_alpha,
+                                     outer_alpha))
+
+
+def soft_square_texture(size, color, center_alpha=255, outer_alpha=0):
+    """
+    Shared version of `arcade.make_soft_square_texture`.
+    """
+    color = tuple(color)
+    key = ("soft_square", size, color, center_alpha, outer_alpha)
+    return TEXTURES.get(key, partial(arcade.make_soft_square_texture, size,
+                                     color, center_alpha, outer_alpha))
@@ -0,0 +1,195 @@
+import math
+
+import arcade
+
+from .helpers import Sprite, Widget
+from .textures import DEFAULT_FONT, text_texture
+
+# where hidden rows are kept, out of the way of hit-testing
+OFFSCREEN = (-1000000, -1000000)
+
+
+class VirtualList(Widget):
+    """
+    Shows a long sequence of items through a fixed pool of row sprites, as
+    many as fit in the widget plus one. Scrolling moves the pool and re-binds
+    the rows that scrolled out of view to the items that scrolled into view.
+
+    Only the pooled rows are registered with the event system, so hit-testing
+    doesn't depend on the amount of items. Handlers are called with the item
+    under the cursor and its index.
+
+    Spritelists can't be clipped, so rows that don't fit in the widget
+    entirely are hidden, instead of spilling over its edges. Hidden rows are
+    moved offscreen, so they can't take events from the rows that are shown.
+
+    - `make_row()` creates a row sprite
+    - `bind_row(row, item, index)` updates a row to show an item
+    """
+
+    def setup(self, items, row_height, make_row, bind_row, events=None,
+              columns=1, on_click=None, on_hover=None, on_out=None):
+        self.items = items
+        self.row_height = row_height
+        self.columns = columns
+        self.bind_row = bind_row
+        self.scroll_offset = 0
+        self.handlers = {"click": on_click, "hover": on_hover, "out": on_out}
+        self.pool_size = (math.ceil(self.height / row_height) + 1) * columns
+        self.rows = [make_row() for _ in range(self.pool_size)]
+        for row in self.rows:
+            if self.spritelist not in row.sprite_lists:
+                self.spritelist.append(row)
+        self.bound = [None] * self.pool_size
+        self.slots = {row: slot for slot, row in enumerate(self.rows)}
+        for slot in range(self.pool_size):
+            self._unbind(slot)
+        if events is not None:
+            for row in self.rows:
+                for event, handler in self.handlers.items():
+                    if handler is not None:
+                        getattr(events, event)(row, self._dispatch, event)
+        self.refresh()
+
+    @property
+    def max_scroll(self):
+        rows = math.ceil(len(self.items) / self.columns)
+        return max(rows * self.row_height - self.height, 0)
+
+    def scroll(self, dy):
+        self.scroll_to(self.scroll_offset + dy)
+
+    def scroll_to(self, offset):
+        offset = min(max(offset, 0), self.max_scroll)
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self.refresh()
+
+    def scroll_to_index(self, index):
+        self.scroll_to((index // self.columns) * self.row_height)
+
+    def set_items(self, items):
+        self.items = items
+        for slot in range(self.pool_size):
+            self._unbind(slot)
+        self.scroll_offset = min(self.scroll_offset, self.max_scroll)
+        self.refresh()
+
+    def visible_indices(self):
+        first = int(self.scroll_offset // self.row_height) * self.columns
+        return range(first, min(first + self.pool_size, len(self.items)))
+
+    def refresh(self):
+        """
+        Position the pooled rows, re-binding only the rows that show another
+        item than before.
+        """
+        self.update_graph()
+        x, y = self.position
+        left = x - self.width / 2
+        bottom = y - self.height / 2
+        top = y + self.height / 2
+        column_width = self.width / self.columns
+        visible = self.visible_indices()
+        for index in visible:
+            slot = index % self.pool_size
+            row = self.rows[slot]
+            if self.bound[slot] != index:
+                self.bound[slot] = index
+                self.bind_row(row, self.items[index], index)
+            line, column = divmod(index, self.columns)
+            row_top = top + self.scroll_offset - line * self.row_height
+            if row_top > top or row_top - self.row_height < bottom:
+                self._hide(row)
+                continue
+            row.position = (left + (column + .5) * column_width,
+                            row_top - self.row_height / 2)
+            row.alpha = 255
+        for slot, index in enumerate(self.bound):
+            if index is not None and index not in visible:
+                self._unbind(slot)
+
+    def _unbind(self, slot):
+        self.bound[slot] = None
+        self._hide(self.rows[slot])
+
+    def _hide(self, row):
+        row.alpha = 0
+        row.position = OFFSCREEN
+
+    def item_for(self, row):
+        index = self.bound[self.slots[row]]
+        if index is None:
+            return None, None
+        return self.items[index], index
+
+    def _dispatch(self, row, x, y, event):
+        item, index = self.item_for(row)
+        if index is not None and row.alpha:
+            self.handlers[event](item, index)
+
+
+class TextSprite(Sprite):
+    """
+    Sprite showing text. Textures are shared through a least recently used
+    cache keyed by font, size, text and color, so text that was shown before
+    isn't rendered again, like a score going up and down.
+    """
+
+    def __init__(self, text="", font_name=DEFAULT_FONT, font_size=12,
+                 color=arcade.color.WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self._text = text
+        self._font_name = font_name
+        self._font_size = font_size
+        self._color = color
+        self._update_texture()
+
+    def _update_texture(self):
+        texture = text_texture(self._text, self._font_name, self._font_size,
+                               self._color)
+        if texture is self.texture:
+            return
+        self.texture = texture
+        half_width, half_height = texture.width / 2, texture.height / 2
+        self.set_hit_box([(-half_width, -half_height),
+                          (half_width, -half_height),
+                          (half_width, half_height),
+                          (-half_width, half_height)])
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if value != self._text:
+            self._text = value
+            self._update_texture()
+
+    @property
+    def font_name(self):
+        return self._font_name
+
+    @font_name.setter
+    def font_name(self, value):
+        self._font_name = value
+        self._update_texture()
+
+    @property
+    def font_size(self):
+        return self._font_size
+
+    @font_size.setter
+    def font_size(self, value):
+        self._font_size = value
+        self._update_texture()
+
+    @property
+    def text_color(self):
+        return self._color
+
+    @text_color.setter
+    def text_color(self, value):
+        self._color = value
+        self._update_texture()
@@ -0,0 +1,59 @@
+"""
+Runs the benchmark suite without a window, and stores the results as JSON.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --quick --filter events --compare results.json
+"""
+from datetime import datetime, timezone
+import argparse
+import json
+import platform
+import sys
+
+from . import (bench_animation, bench_events, bench_helpers, bench_scene,  # noqa
+               bench_textures)
+from .suite import compare, run_all
+
+
+def _version():
+    try:
+        from importlib.metadata import version
+        return version("arcade-curtains")
+    except Exception:
+        return "unknown"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--output", "-o", help="file to write results to")
+    parser.add_argument("--filter", "-k", help="only run matching benchmarks")
+    parser.add_argument(
+        "--quick", action="store_true", help="only run the smaller sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", help="results file to compare against")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.filter, quick=args.quick, repeat=args.repeat)
+    output = {
+        "meta": {
+            "version": _version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(output, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)["results"]
+        for name, params, ratio in compare(results, baseline):
+            print("{:<60} {:6.2f}x".format(
+                "{}({})".format(name, params), ratio))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
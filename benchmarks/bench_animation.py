@@ -0,0 +1,36 @@
+import arcade
+
+from arcade_curtains.animation import AnimationManager, KeyFrame, Sequence
+
+from .suite import benchmark
+
+
+def _sequence(keyframes, loop=False):
+    sequence = Sequence(loop=loop)
+    for idx in range(keyframes):
+        sequence.add_keyframe(
+            idx, KeyFrame(position=(idx, idx), angle=idx, alpha=idx % 255))
+    return sequence
+
+
+@benchmark(keyframes=[2, 10, 100])
+def sequence_compilation(keyframes):
+    sequence = _sequence(keyframes)
+
+    def run():
+        sequence._to_point_in_times()
+
+    return run
+
+
+@benchmark(animators=[1000, 5000, 20000])
+def animation_blip(animators):
+    manager = AnimationManager()
+    sequence = _sequence(2, loop=True)
+    for _ in range(animators):
+        manager.fire(arcade.Sprite(), sequence)
+
+    def run():
+        manager._blip(1 / 60)
+
+    return run
@@ -0,0 +1,112 @@
+import random
+
+import arcade
+
+from arcade_curtains.event import EventGroup, EventHandler, SpriteEvent
+from arcade_curtains.helpers import Widget
+
+from .suite import benchmark
+
+
+def _sprites(count, size=10, area=(1000, 1000)):
+    rnd = random.Random(count)
+    sprites = []
+    for _ in range(count):
+        sprite = arcade.Sprite()
+        sprite.width = size
+        sprite.height = size
+        sprite.position = (rnd.uniform(0, area[0]), rnd.uniform(0, area[1]))
+        sprites.append(sprite)
+    return sprites
+
+
+def _handler(*args, **kwargs):
+    pass
+
+
+@benchmark(sprites=[100, 1000, 10000, 50000])
+def hit_testing(sprites):
+    group = EventGroup()
+    group.all_sprites = _sprites(sprites)
+
+    def run():
+        group._get_sprite_at(500, 500)
+
+    return run
+
+
+@benchmark(widgets=[10, 100, 1000], sprites=[10, 50],
+           mode=["flat", "containers"])
+def widget_hit_testing(widgets, sprites, mode):
+    rnd = random.Random(widgets)
+    group = EventGroup()
+    panels = []
+    for _ in range(widgets):
+        panel = _Panel(rnd.uniform(0, 1000), rnd.uniform(0, 1000), 100, 100,
+                       sprites)
+        panels.append(panel)
+        group.all_sprites.extend(panel.spritelist)
+        if mode == "containers":
+            group.add_container(panel)
+
+    def run():
+        group._get_sprite_at(500, 500)
+
+    return run
+
+
+class _Panel(Widget):
+    def setup(self, sprites):
+        # sprites created in setup are added to the widget's spritelist
+        for sprite in _sprites(sprites, area=(100, 100)):
+            sprite.position = (sprite.center_x - 50, sprite.center_y - 50)
+
+
+@benchmark(sprites=[100, 1000, 10000, 50000])
+def mouse_events(sprites):
+    group = EventGroup()
+    group.all_sprites = _sprites(sprites)
+    # registered directly, group.hover and group.out dedupe all_sprites on
+    # every call, which doesn't scale to this many sprites
+    for event in (SpriteEvent.HOVER, SpriteEvent.OUT):
+        for sprite in group.all_sprites:
+            group.sprite_handlers[event][sprite].append((_handler, (), {}))
+    # alternate between two sprites, hovering one and leaving the other
+    points = iter(_cycle([group.all_sprites[0].position,
+                          group.all_sprites[1].position]))
+
+    def run():
+        group.trigger_mouse_events(*next(points))
+
+    return run
+
+
+@benchmark(handlers=[100, 1000, 5000])
+def handler_registration(handlers):
+    sprites = _sprites(handlers)
+
+    def run():
+        group = EventGroup()
+        for sprite in sprites:
+            group.click(sprite, _handler)
+        for sprite in sprites:
+            group.remove_click(sprite, _handler)
+
+    return run
+
+
+@benchmark(handlers=[10, 100, 1000])
+def frame_dispatch(handlers):
+    events = EventHandler()
+    for _ in range(handlers):
+        events.frame(lambda delta_time: None)
+
+    def run():
+        events.trigger_frame(1 / 60)
+
+    return run
+
+
+def _cycle(items):
+    while True:
+        yield from items
@@ -0,0 +1,97 @@
+import arcade
+
+from arcade_curtains.graph import SceneGraph
+from arcade_curtains.helpers import (AnchorPoint, ObservableSprite, TriggerAttr,
+                                     TriggerGroup)
+
+from .suite import benchmark
+
+WRITES = 1000
+
+
+def _observer(sprite, attribute, old, new):
+    pass
+
+
+@benchmark(kind=["sprite", "observable", "observed"])
+def observable_setattr(kind):
+    if kind == "sprite":
+        sprite = arcade.Sprite()
+    else:
+        sprite = ObservableSprite()
+    if kind == "observed":
+        sprite.after_change("center_x", _observer)
+
+    def run():
+        for value in range(WRITES):
+            sprite.center_x = value
+
+    return run
+
+
+@benchmark(depth=[1, 10, 50], sprites=[10, 100], moves=[1, 10],
+           mode=["eager", "graph"])
+def anchor_propagation(depth, sprites, moves, mode):
+    graph = SceneGraph()
+    if mode == "graph":
+        root = graph.add_node()
+    else:
+        root = AnchorPoint(0, 0)
+    anchor = root
+    for _ in range(depth):
+        for _ in range(sprites):
+            anchor.dock(arcade.Sprite())
+        if mode == "graph":
+            child = graph.add_node(parent=anchor)
+        else:
+            child = AnchorPoint(0, 0)
+            anchor.dock(child)
+        anchor = child
+    state = {"frame": 0}
+
+    def run():
+        # several assignments within one frame, like an animated container
+        state["frame"] ^= 1
+        for idx in range(moves):
+            root.position = (idx, state["frame"])
+        graph.update()
+
+    return run
+
+
+@benchmark(sprites=[300, 3000], mode=["anchor", "graph"])
+def composite_rotation(sprites, mode):
+    graph = SceneGraph()
+    root = graph.add_node() if mode == "graph" else AnchorPoint(0, 0)
+    for idx in range(sprites):
+        root.dock(arcade.Sprite(center_x=idx % 30, center_y=idx // 30))
+
+    def run():
+        root.angle += 1
+        graph.update()
+
+    return run
+
+
+@benchmark(sprites=[1000, 20000], mode=["observed", "group"])
+def health_trigger(sprites, mode):
+    health = TriggerAttr("health")
+    population = [ObservableSprite() for _ in range(sprites)]
+    for sprite in population:
+        sprite.health = 100
+    if mode == "observed":
+        for sprite in population:
+            sprite.trigger(health <= 0, _handler)
+    group = TriggerGroup(population, health <= 0, _handler)
+
+    def run():
+        for sprite in population:
+            sprite.health -= 1
+        if mode == "group":
+            group.evaluate()
+
+    return run
+
+
+def _handler(*args):
+    pass
@@ -0,0 +1,80 @@
+import random
+
+import arcade
+
+from arcade_curtains import BaseScene, ChunkedSpriteList, Curtains
+
+from .suite import SkipBenchmark, benchmark
+
+_WINDOW = None
+
+
+def _window():
+    global _WINDOW
+    if _WINDOW is None:
+        try:
+            _WINDOW = arcade.Window(800, 600, visible=False)
+        except Exception as e:
+            raise SkipBenchmark("no GL context available ({})".format(
+                e.__class__.__name__))
+    return _WINDOW
+
+
+class DrawScene(BaseScene):
+    def setup(self, sprites):
+        rnd = random.Random(sprites)
+        self.sprites = arcade.SpriteList()
+        texture = arcade.make_soft_square_texture(10, arcade.color.WHITE)
+        for _ in range(sprites):
+            sprite = arcade.Sprite()
+            sprite.texture = texture
+            sprite.position = (rnd.uniform(0, 800), rnd.uniform(0, 600))
+            self.sprites.append(sprite)
+
+
+@benchmark(sprites=[1000, 10000, 50000])
+def scene_draw(sprites):
+    window = _window()
+    scene = DrawScene(sprites)
+    scene._bind(window, Curtains())
+
+    def run():
+        scene.draw()
+        window.flip()
+
+    return run
+
+
+class TileMapScene(BaseScene):
+    def setup(self, tiles, mode):
+        texture = arcade.make_soft_square_texture(16, arcade.color.WHITE)
+        sprites = []
+        side = int(tiles ** .5)
+        for idx in range(side * side):
+            sprite = arcade.Sprite()
+            sprite.texture = texture
+            sprite.position = (idx % side * 16 + 8, idx // side * 16 + 8)
+            sprites.append(sprite)
+        if mode == "chunked":
+            self.tiles = ChunkedSpriteList(sprites)
+        else:
+            self.tiles = arcade.SpriteList(is_static=True)
+            self.tiles.extend(sprites)
+
+
+@benchmark(tiles=[20000, 200000], mode=["flat", "chunked"])
+def tile_map_draw(tiles, mode):
+    window = _window()
+    scene = TileMapScene(tiles, mode)
+    scene._bind(window, Curtains())
+    state = {"frame": 0}
+
+    def run():
+        # scroll the camera over the map
+        state["frame"] = (state["frame"] + 1) % 100
+        left = state["frame"] * 8
+        arcade.set_viewport(left, left + 800, 0, 600)
+        scene.draw()
+        window.flip()
+
+    return run
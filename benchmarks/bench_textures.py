@@ -0,0 +1,24 @@
+import arcade
+
+from arcade_curtains.textures import TEXTURES, soft_square_texture
+
+from .suite import benchmark
+
+COLORS = [arcade.color.WHITE, arcade.color.TEAL, arcade.color.CORNFLOWER_BLUE]
+
+
+@benchmark(sprites=[100, 1000], mode=["arcade", "cached"])
+def spawn_textured_sprites(sprites, mode):
+    if mode == "arcade":
+        make = arcade.make_soft_square_texture
+    else:
+        make = soft_square_texture
+
+    def run():
+        for _ in range(sprites):
+            sprite = arcade.Sprite()
+            sprite.textures = [make(32, color, 255, 255) for color in COLORS]
+            sprite.texture = sprite.textures[0]
+
+    TEXTURES.clear()
+    return run
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from time import perf_counter
+import statistics
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(**params):
+    """
+    Registers a benchmark. The decorated function receives one value of every
+    parameter, sets up what it needs, and returns the callable to be timed.
+    """
+
+    def decorator(fn):
+        BENCHMARKS["{}.{}".format(fn.__module__.split(".")[-1],
+                                  fn.__name__)] = (fn, params)
+        return fn
+
+    return decorator
+
+
+def _param_sets(params, quick):
+    sets = [{}]
+    for name, values in params.items():
+        if quick and all(isinstance(value, int) for value in values):
+            values = values[:2]
+        sets = [dict(s, **{name: value}) for s in sets for value in values]
+    return sets
+
+
+def _autorange(fn, minimum=.05):
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            fn()
+        duration = perf_counter() - start
+        if duration >= minimum or number >= 1000000:
+            return number
+        number *= 10
+
+
+class SkipBenchmark(Exception):
+    pass
+
+
+def run_benchmark(name, fn, params, repeat=5):
+    try:
+        timed = fn(**params)
+    except SkipBenchmark as e:
+        return {"name": name, "params": params, "skipped": str(e)}
+    number = _autorange(timed)
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            timed()
+        timings.append((perf_counter() - start) / number)
+    return {
+        "name": name,
+        "params": params,
+        "number": number,
+        "repeat": repeat,
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if repeat > 1 else 0,
+    }
+
+
+def run_all(pattern=None, quick=False, repeat=5, report=print):
+    results = []
+    for name, (fn, params) in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        for param_set in _param_sets(params, quick):
+            result = run_benchmark(name, fn, param_set, repeat=repeat)
+            report(format_result(result))
+            results.append(result)
+    return results
+
+
+def format_result(result):
+    params = ", ".join("{}={}".format(k, v)
+                       for k, v in result["params"].items())
+    label = "{}({})".format(result["name"], params)
+    if "skipped" in result:
+        return "{:<60} skipped: {}".format(label, result["skipped"])
+    return "{:<60} {:12.3f}us".format(label, result["min"] * 1e6)
+
+
+def result_key(result):
+    return (result["name"], tuple(sorted(result["params"].items())))
+
+
+def compare(results, baseline):
+    """
+    Returns (name, params, ratio) for every result also in the baseline,
+    where ratio is the current minimum timing divided by the baseline one.
+    """
+    previous = {result_key(r): r for r in baseline if "min" in r}
+    comparison = []
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None or "min" not in result:
+            continue
+        comparison.append(
+            (result["name"], result["params"], result["min"] / old["min"]))
+    return comparison
@@ -1,6 +1,7 @@
 import arcade
 
 from arcade_curtains import Curtains, BaseScene, AnchorPoint
+from arcade_curtains.textures import soft_circle_texture
 
 import math
 
@@ -23,8 +24,7 @@ class CircleSprite(arcade.Sprite):
         size = kwargs.pop('size', 100)
         super().__init__(*args, **kwargs)
         self.textures = [
-            arcade.make_soft_circle_texture(size, arcade.color.WHITE, 255,
-                                            255),
+            soft_circle_texture(size, arcade.color.WHITE, 255, 255),
         ]
         self.texture = self.textures[0]
 
@@ -1,14 +1,15 @@
 import arcade
 
 from arcade_curtains import Curtains, BaseScene
+from arcade_curtains.textures import soft_circle_texture
 
 
 class CircleSprite(arcade.Sprite):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.textures = [
-            arcade.make_soft_circle_texture(100, arcade.color.WHITE, 255, 255),
-            arcade.make_soft_circle_texture(100, arcade.color.GREEN, 255, 255)
+            soft_circle_texture(100, arcade.color.WHITE, 255, 255),
+            soft_circle_texture(100, arcade.color.GREEN, 255, 255)
         ]
         self.texture = self.textures[0]
         self.center_x = 70
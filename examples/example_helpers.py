@@ -1,6 +1,10 @@
+from functools import partial
+
 import arcade
 
-from arcade_curtains import Curtains
+from arcade_curtains import Curtains, EdgeLayout, Row
+from arcade_curtains.textures import (TextureCache, soft_circle_texture,
+                                      soft_square_texture)
 from PIL import Image, ImageFont, ImageDraw
 
 WHITE = arcade.color.WHITE
@@ -11,6 +15,8 @@ TEAL = arcade.color.TEAL
 ROYAL_PURPLE = arcade.color.ROYAL_PURPLE
 CORNFLOWER_BLUE = arcade.color.CORNFLOWER_BLUE
 
+BUTTON_TEXTURES = TextureCache()
+
 
 class BasicSprite(arcade.Sprite):
     texture_maker = None
@@ -33,7 +39,7 @@ class BasicSprite(arcade.Sprite):
 
 class SquareSprite(BasicSprite):
     def get_texture(self, size, color):
-        return arcade.make_soft_square_texture(size, color, 255, 255)
+        return soft_square_texture(size, color, 255, 255)
 
 
 class Button(SquareSprite):
@@ -53,6 +59,10 @@ class Button(SquareSprite):
         super().__init__(*args, **kwargs)
 
     def get_texture(self, size, color):
+        key = (self.text, color, self.button_width, self.button_height)
+        return BUTTON_TEXTURES.get(key, partial(self.render, color))
+
+    def render(self, color):
         font = ImageFont.truetype("FreeMonoBold", 20)
         img = Image.new("RGBA", (self.button_width, self.button_height), color)
         draw = ImageDraw.Draw(img)
@@ -79,23 +89,22 @@ class ButtonGroup:
     def __init__(self, spritelist, events, buttons, width, position, padding):
         self.buttons = {}
         self.spritelist = spritelist
-        self.x, self.y = position
-        self.padding = padding
+        self.position = position
         self.events = events
-        self.tab_width = self.button_class.default_width
-        self.start_x = (self.x - (width / 2)) + (self.tab_width / 2) + padding
         self.active = None
+        self.row = Row(spacing=padding)
+        self.layout = EdgeLayout(width, self.button_class.default_height)
+        self.layout.add(self.row, "left", margin=padding)
 
         for text in buttons:
             self.add_button(text)
 
     def add_button(self, text):
         btn = self.button_class(text=text, group=self, events=self.events)
-        btn.center_x = self.start_x + (
-            (self.tab_width + self.padding) * len(self.buttons))
-        btn.center_y = self.y
         self.buttons[text] = btn
         self.spritelist.append(btn)
+        self.row.add(btn)
+        self.layout.apply(*self.position)
 
     def __iter__(self):
         return iter(self.buttons.values())
@@ -170,8 +179,8 @@ class CircleSprite(arcade.Sprite):
     def __init__(self, color=arcade.color.WHITE, size=100, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.textures = [
-            arcade.make_soft_circle_texture(size, color, 255, 255),
-            arcade.make_soft_circle_texture(size, arcade.color.GREEN, 255, 255)
+            soft_circle_texture(size, color, 255, 255),
+            soft_circle_texture(size, arcade.color.GREEN, 255, 255)
         ]
         self.texture = self.textures[0]
         self.center_x = 70
@@ -315,11 +315,11 @@ class Controller:
         char.special = 0
 
         stamina = TriggerAttr('stamina')
-        self.char.trigger(stamina >= 100, self.get_input)
-        self.char.trigger(stamina == 0, self.cleanup)
+        self.char.trigger((stamina >= 100).edge(), self.get_input)
+        self.char.trigger((stamina == 0).edge(), self.cleanup)
 
         health = TriggerAttr('health')
-        self.char.trigger(health == 0, char.die)
+        self.char.trigger((health == 0).once(), char.die)
 
     def get_input(self):
         get_state().set_waiting()
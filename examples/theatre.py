@@ -3,6 +3,7 @@ from scipy.interpolate import interp1d
 
 from arcade_curtains import Curtains
 from arcade_curtains.scene import BaseScene
+from arcade_curtains.textures import soft_circle_texture, soft_square_texture
 
 SCREEN_WIDTH = 620
 SCREEN_HEIGHT = 260
@@ -36,12 +37,12 @@ class BasicSprite(arcade.Sprite):
 
 class SquareSprite(BasicSprite):
     def get_texture(self, size, color):
-        return arcade.make_soft_square_texture(size, color, 255, 255)
+        return soft_square_texture(size, color, 255, 255)
 
 
 class CircleSprite(BasicSprite):
     def get_texture(self, size, color):
-        return arcade.make_soft_circle_texture(size, color, 255, 255)
+        return soft_circle_texture(size, color, 255, 255)
 
     def green(self, *args):
         self.set_texture(1)
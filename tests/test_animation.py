@@ -289,3 +289,32 @@ def test_it_can_reconstruct_anim_queue_on_invalid_kill():
     chain.current_animator = current_animator
     assert not chain.kill(mock.Mock())
     assert list(chain.anim_queue) == [anim]
+
+
+def test_it_can_scale_animation_time():
+    s = a.Sequence()
+    s.add_keyframes((0, a.KeyFrame(position=(10, 10))),
+                    (1, a.KeyFrame(position=(10, 100))))
+    inst = arcade.Sprite()
+    manager = a.AnimationManager()
+    manager.time_scale = .5
+    manager.fire(inst, s)
+    manager._blip(.5)
+    assert inst.position == (10, 32.5)
+
+
+def test_it_can_pause_and_step_animations():
+    s = a.Sequence()
+    s.add_keyframes((0, a.KeyFrame(position=(10, 10))),
+                    (1, a.KeyFrame(position=(10, 100))))
+    inst = arcade.Sprite()
+    manager = a.AnimationManager()
+    manager.fire(inst, s)
+    manager.pause()
+    manager._blip(.5)
+    assert inst.position == (0, 0)
+    manager.step(.5)
+    assert inst.position == (10, 55)
+    manager.resume()
+    manager._blip(.5)
+    assert inst.position == (10, 100)
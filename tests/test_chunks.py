@@ -0,0 +1,87 @@
+from unittest import mock
+
+import arcade
+
+from arcade_curtains import BaseScene, ChunkedSpriteList, Viewport
+
+
+def _tile(x, y, size=10):
+    sprite = arcade.SpriteSolidColor(size, size, arcade.color.WHITE)
+    sprite.position = (x, y)
+    return sprite
+
+
+def _tiles(width, height, size=10):
+    return [
+        _tile(x * size + size / 2, y * size + size / 2, size)
+        for x in range(width) for y in range(height)
+    ]
+
+
+def test_it_puts_sprites_in_chunks_by_position():
+    tiles = _tiles(20, 10)
+    chunked = ChunkedSpriteList(tiles, chunk_size=50)
+    assert len(chunked) == 200
+    assert sorted(chunked.chunks) == [(x, y) for x in range(4)
+                                      for y in range(2)]
+    assert all(len(chunk) == 25 for chunk in chunked.chunks.values())
+    assert tiles[0] in chunked
+
+
+def test_it_only_draws_chunks_in_the_viewport():
+    chunked = ChunkedSpriteList(_tiles(40, 40), chunk_size=100,
+                                viewport=Viewport(150, 150))
+    visible = chunked.visible_chunks()
+    assert visible == [chunked.chunks[key] for key in
+                       [(0, 0), (1, 0), (0, 1), (1, 1)]]
+
+    with mock.patch.object(arcade.SpriteList, "draw") as draw:
+        chunked.draw(filter="nearest")
+    assert draw.call_count == 4
+    draw.assert_called_with(filter="nearest")
+
+    chunked.viewport.bounds = (210, 210, 390, 390)
+    assert chunked.visible_chunks() == [chunked.chunks[(2, 2)],
+                                        chunked.chunks[(3, 2)],
+                                        chunked.chunks[(2, 3)],
+                                        chunked.chunks[(3, 3)]]
+
+
+def test_it_follows_the_arcade_viewport():
+    chunked = ChunkedSpriteList(_tiles(40, 40), chunk_size=100)
+    with mock.patch("arcade.get_viewport", return_value=(310, 390, 0, 90)):
+        assert chunked.visible_chunks() == [chunked.chunks[(3, 0)]]
+
+
+def test_it_draws_chunks_with_sprites_reaching_into_the_viewport():
+    large = _tile(150, 50, size=100)
+    chunked = ChunkedSpriteList([_tile(50, 50), large], chunk_size=100,
+                                viewport=Viewport(90, 90))
+    assert chunked.visible_chunks() == [chunked.chunks[(0, 0)],
+                                        chunked.chunks[(1, 0)]]
+
+
+def test_it_moves_and_removes_sprites():
+    tile = _tile(50, 50)
+    chunked = ChunkedSpriteList([tile, _tile(60, 60)], chunk_size=100,
+                                viewport=Viewport(100, 100))
+    assert len(chunked.visible_chunks()) == 1
+
+    tile.position = (450, 50)
+    chunked.move(tile)
+    assert tile in chunked.chunks[(4, 0)]
+    assert tile not in chunked.chunks[(0, 0)]
+
+    chunked.remove(tile)
+    assert (4, 0) not in chunked.chunks
+    assert tile not in chunked
+    assert len(chunked) == 1
+
+
+def test_a_scene_draws_chunked_spritelists():
+    class MapScene(BaseScene):
+        def setup(self):
+            self.tiles = ChunkedSpriteList(_tiles(2, 2))
+
+    scene = MapScene()
+    assert scene._sprite_lists == (scene.tiles, )
@@ -1,9 +1,15 @@
+import time
 from unittest.mock import Mock
 
+import arcade
 import pytest
 from arcade.key import ESCAPE
 
-from arcade_curtains.event import EventHandler, EventGroup
+from arcade_curtains.event import (EMPTY_SPRITE, EventHandler, EventGroup,
+                                   Event, SpriteEvent)
+from arcade_curtains.helpers import (ObservableSprite, TriggerAttr, Widget,
+                                     after_change)
+from arcade_curtains.profiler import SlowHandlerWarning, handler_name
 
 
 @pytest.mark.parametrize("event,triggers", [
@@ -83,3 +89,156 @@ def test_it_can_disable_an_event_group(sprite):
     eg.disable()
     ev.trigger_key_press(ESCAPE)
     sprite.handler.assert_called_once()
+
+
+def test_it_can_profile_handlers_per_event_type_and_group(sprite):
+    ev = EventHandler()
+    eg = EventGroup('hud')
+    ev.register_group(eg)
+    profiler = ev.enable_profiling()
+    ev.frame(sprite.handler)
+    eg.frame(sprite.handler)
+    ev.down(sprite, sprite.handler)
+
+    ev.trigger_frame(1)
+    ev.trigger_frame(1)
+    ev.trigger_down(50, 50)
+
+    name = handler_name(sprite.handler)
+    assert profiler.stats[('default', Event.FRAME, name)].calls == 2
+    assert profiler.stats[('hud', Event.FRAME, name)].calls == 2
+    assert profiler.stats[('default', SpriteEvent.DOWN, name)].calls == 1
+    assert sprite.handler.call_count == 5
+
+    ev.disable_profiling()
+    assert eg.profiler is None
+
+
+def test_it_can_flag_slow_handlers(sprite):
+    def slow_handler(delta_time):
+        time.sleep(.002)
+
+    ev = EventHandler()
+    profiler = ev.enable_profiling(budget=.001)
+    ev.frame(slow_handler)
+    ev.frame(sprite.handler)
+
+    with pytest.warns(SlowHandlerWarning):
+        ev.trigger_frame(1)
+        profiler.end_frame()
+
+    key = ('default', Event.FRAME, handler_name(slow_handler))
+    assert profiler.slow_handlers == {key}
+    assert profiler.stats[key].slow_frames == 1
+    assert profiler.stats[key].frame_time == 0
+    assert profiler.top_handlers(1)[0][0] == handler_name(slow_handler)
+
+
+def test_it_routes_hit_tests_through_widget_bounds():
+    def button(x, y):
+        sprite = arcade.Sprite()
+        sprite.width, sprite.height = 20, 20
+        sprite.position = (x, y)
+        return sprite
+
+    class Panel(Widget):
+        def setup(self):
+            self.button = button(0, 0)
+            # outside of the panel's bounds, so never hit
+            self.outside = button(100, 0)
+
+    ev = EventHandler()
+    panel = Panel(50, 50, 40, 40)
+    hidden = Panel(200, 200, 40, 40)
+    hidden.hide()
+    loose = button(300, 300)
+    for sprite in (panel.button, panel.outside, hidden.button, loose):
+        ev.click(sprite, sprite_handler)
+    ev.add_container(panel)
+    ev.add_container(hidden)
+
+    group = ev.event_group
+    assert group._get_sprite_at(50, 50) is panel.button
+    assert group._get_sprite_at(300, 300) is loose
+    assert group._get_sprite_at(150, 50) is EMPTY_SPRITE
+    assert group._get_sprite_at(200, 200) is EMPTY_SPRITE
+    assert group._sprites_near((0, 0)) == [loose]
+
+    ev.remove_container(hidden)
+    assert group._get_sprite_at(200, 200) is hidden.button
+
+
+def _button(x, y):
+    sprite = arcade.Sprite()
+    sprite.width, sprite.height = 10, 10
+    sprite.position = (x, y)
+    return sprite
+
+
+class Child(Widget):
+    def setup(self):
+        self.sprite = _button(0, 0)
+
+
+class Parent(Widget):
+    def setup(self):
+        self.sprite = _button(0, 0)
+        self.child = Child(50, 0, 20, 20)
+
+
+def test_it_hit_tests_widgets_that_moved_in_a_container():
+    ev = EventHandler()
+    parent = Parent(0, 0, None, None)
+    handler = Mock()
+    ev.click(parent.child.sprite, handler)
+    ev.add_container(parent)
+    group = ev.event_group
+    assert group._get_sprite_at(50, 0) is parent.child.sprite
+
+    parent.child.position = (200, 0)
+    ev.trigger_down(200, 0)
+    ev.trigger_up(200, 0)
+    handler.assert_called_once()
+
+
+def test_it_splits_sprites_again_when_a_container_changes():
+    ev = EventHandler()
+    parent = Parent(0, 0, None, None)
+    extra = _button(30, 0)
+    for sprite in (parent.sprite, parent.child.sprite, extra):
+        ev.click(sprite, sprite_handler)
+    ev.add_container(parent)
+    group = ev.event_group
+    assert group._sprites_near((-100, 0)) == [extra]
+
+    parent.spritelist.append(extra)
+    assert group._sprites_near((-100, 0)) == []
+    assert group._get_sprite_at(30, 0) is extra
+
+    parent.spritelist.remove(extra)
+    assert group._sprites_near((-100, 0)) == [extra]
+
+    child = parent.child
+    parent.children.remove(child)
+    assert set(group._sprites_near((-100, 0))) == {child.sprite, extra}
+
+
+def test_it_can_kill_sprites_with_unassigned_observed_attributes():
+    class Enemy(ObservableSprite):
+        @after_change('health')
+        def on_health(self, *args):
+            pass
+
+    enemy = Enemy()
+    enemy.texture = arcade.make_soft_square_texture(10, arcade.color.WHITE)
+    enemy.trigger(TriggerAttr('hp') <= 0, Mock())
+    ev = EventHandler()
+    ev.click(enemy, sprite_handler)
+    ev.frame(enemy.on_health)
+    ev.kill(enemy)
+    assert enemy not in ev.event_group.all_sprites
+    assert not ev.event_group.handlers[Event.FRAME]
+
+
+def sprite_handler(*args):
+    pass
@@ -0,0 +1,235 @@
+import arcade
+import numpy as np
+import pytest
+
+from arcade_curtains import BaseScene, HeadlessCurtains, SceneGraph
+from arcade_curtains.helpers import ObservableSprite, Widget
+
+
+class Scene(BaseScene):
+    def setup(self):
+        pass
+
+
+@pytest.fixture(scope='function')
+def headless():
+    curtains = HeadlessCurtains()
+    curtains.add_scene('scene1', Scene())
+    curtains.set_scene('scene1')
+    yield curtains
+    arcade.set_window(None)
+
+
+def test_it_moves_docked_sprites_on_update():
+    graph = SceneGraph()
+    root = graph.add_node((100, 100))
+    child = graph.add_node((110, 100), parent=root)
+    sprite = arcade.Sprite(center_x=120, center_y=130)
+    child.dock(sprite)
+
+    root.move(10, 20)
+    assert sprite.position == (120, 130)
+    assert child.position == (120, 120)
+    assert child.local_position == (10, 0)
+
+    graph.update()
+    assert sprite.position == (130, 150)
+    assert not graph.dirty.any()
+
+
+def test_it_only_writes_changed_subtrees():
+    graph = SceneGraph(capacity=2)
+    left = graph.add_node()
+    right = graph.add_node()
+    left_sprite, right_sprite = arcade.Sprite(), arcade.Sprite()
+    left.dock(left_sprite)
+    right.dock(right_sprite)
+    right_sprite.center_x = 50
+
+    left.position = (10, 10)
+    graph.update()
+    assert left_sprite.position == (10, 10)
+    assert right_sprite.position == (50, 0)
+    assert len(graph) == 4
+
+
+def test_it_keeps_sprite_offsets_set_outside_of_the_graph():
+    graph = SceneGraph()
+    node = graph.add_node()
+    sprite = arcade.Sprite()
+    node.dock(sprite)
+
+    sprite.center_x = 5
+    node.move(10, 0)
+    graph.update()
+    assert sprite.position == (15, 0)
+    node.move(10, 0)
+    graph.update()
+    assert sprite.position == (25, 0)
+
+
+def test_it_notifies_coordinate_observers_of_docked_sprites():
+    graph = SceneGraph()
+    node = graph.add_node()
+    sprite = ObservableSprite()
+    changes = []
+    sprite.after_change('center_x', lambda s, a, old, new: changes.append(new))
+    node.dock(sprite)
+
+    node.move(10, 20)
+    graph.update()
+    assert sprite.position == (10, 20)
+    assert changes == [10]
+
+
+def test_it_stops_writing_to_removed_sprites():
+    graph = SceneGraph()
+    node = graph.add_node()
+    child = graph.add_node((5, 0), parent=node)
+    sprite = arcade.Sprite()
+    node.dock(sprite)
+    graph.add_sprite(arcade.Sprite(), parent=child)
+
+    graph.remove_sprite(sprite)
+    graph.remove_sprite(sprite)
+    assert sprite not in graph.sprite_nodes
+    node.move(10, 0)
+    graph.update()
+    assert sprite.position == (0, 0)
+    assert child.position == (15, 0)
+
+
+def test_it_can_reparent_nodes():
+    graph = SceneGraph()
+    root = graph.add_node((10, 10))
+    child = graph.add_node((50, 50))
+    root.dock(child)
+    assert child.parent == root
+    assert child.local_position == (40, 40)
+
+    with pytest.raises(ValueError):
+        child.dock(root)
+    with pytest.raises(ValueError):
+        root.dock(SceneGraph().add_node())
+
+
+def test_widgets_can_be_placed_in_a_graph():
+    class Inner(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite(center_x=10, center_y=10)
+
+    class Outer(Widget):
+        def setup(self):
+            self.inner = Inner(0, 0, 20, 20)
+
+    graph = SceneGraph()
+    with graph:
+        outer = Outer(100, 100, 50, 50)
+    assert outer.inner.graph is graph
+    assert outer.inner.anchor.parent == outer.anchor
+    assert len(graph) == 3
+
+    outer.position = (200, 100)
+    assert outer.inner.position == (200, 100)
+    graph.update()
+    assert outer.inner.sprite.position == (210, 110)
+
+
+def test_widgets_in_a_graph_invalidate_their_parents_bounds():
+    class Child(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite()
+            self.sprite.width = self.sprite.height = 10
+
+    class Parent(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite()
+            self.sprite.width = self.sprite.height = 10
+            self.child = Child(50, 0, 20, 20)
+
+    class Root(Widget):
+        def setup(self):
+            self.parent = Parent(0, 0, None, None)
+
+    graph = SceneGraph()
+    with graph:
+        root = Root(0, 0, None, None)
+    graph.update()
+    parent = root.parent
+    assert parent.bounds == (-5, -10, 60, 10)
+
+    parent.child.position = (200, 0)
+    assert parent.bounds == (-5, -10, 210, 10)
+
+    root.position = (0, 100)
+    graph.update()
+    assert parent.bounds == (-5, 90, 210, 110)
+
+
+def test_scenes_update_their_graph_before_drawing(headless):
+    scene = headless.current_scene
+    node = scene.graph.add_node()
+    sprite = arcade.Sprite()
+    node.dock(sprite)
+
+    node.position = (30, 40)
+    headless.advance()
+    assert sprite.position == (30, 40)
+
+
+def test_it_rotates_and_scales_docked_sprites():
+    graph = SceneGraph()
+    root = graph.add_node((100, 100))
+    child = graph.add_node((110, 100), parent=root)
+    sprite = arcade.Sprite(center_x=120, center_y=100)
+    child.dock(sprite)
+
+    root.rotate(90)
+    root.scale = 2
+    assert child.position == pytest.approx((100, 120))
+    graph.update()
+    assert sprite.position == pytest.approx((100, 140))
+    assert sprite.angle == pytest.approx(90)
+    assert sprite.scale == pytest.approx(2)
+    assert child.matrix == pytest.approx(
+        np.array([[0, -2, 100], [2, 0, 120], [0, 0, 1]]))
+
+
+def test_it_positions_nodes_in_world_coordinates_when_rotated():
+    graph = SceneGraph()
+    root = graph.add_node(angle=90)
+    child = graph.add_node((0, 10), parent=root)
+    assert child.local_position == pytest.approx((10, 0))
+
+    child.position = (-10, 0)
+    assert child.local_position == pytest.approx((0, 10))
+    child.move(10, 0)
+    assert child.position == pytest.approx((0, 0))
+
+
+def test_it_keeps_sprite_rotations_set_outside_of_the_graph():
+    graph = SceneGraph()
+    node = graph.add_node()
+    sprite = arcade.Sprite(center_x=10)
+    node.dock(sprite)
+
+    sprite.angle = 45
+    node.rotate(90)
+    graph.update()
+    assert sprite.position == pytest.approx((0, 10))
+    assert sprite.angle == pytest.approx(135)
+
+
+def test_widgets_can_be_rotated_in_a_graph():
+    class MyWidget(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite(center_x=10)
+
+    graph = SceneGraph()
+    with graph:
+        widget = MyWidget(0, 0, 20, 20)
+    widget.angle = 180
+    graph.update()
+    assert widget.angle == 180
+    assert widget.sprite.position == pytest.approx((-10, 0))
+    assert widget.sprite.angle == pytest.approx(180)
@@ -1,3 +1,5 @@
+import array
+import gc
 import operator as op
 from unittest import mock
 
@@ -5,6 +7,7 @@ import pytest
 import arcade
 
 import arcade_curtains as c
+from arcade_curtains import HeadlessWindow
 from arcade_curtains.helpers import TriggerAttr, Widget
 
 orientations = {
@@ -65,6 +68,333 @@ def test_it_can_observe_trigger_change():
     handler.assert_called_once()
 
 
+def test_it_can_observe_sprite_properties():
+    class MySprite(c.helpers.ObservableSprite):
+        pass
+
+    observable = MySprite()
+    handler = mock.Mock()
+    observable.after_change('center_x', handler)
+    observable.center_x = 10
+    handler.assert_called_once_with(observable, 'center_x', 0, 10)
+    assert observable.position == (10, 0)
+    assert isinstance(observable, MySprite)
+
+
+def test_it_only_installs_observers_for_observed_attributes():
+    observable1 = c.helpers.ObservableSprite()
+    observable2 = c.helpers.ObservableSprite()
+    observable3 = c.helpers.ObservableSprite()
+    observable1.before_change('alpha', mock.Mock())
+    observable1.after_change('health', mock.Mock())
+    observable2.after_change('health', mock.Mock())
+    observable2.before_change('alpha', mock.Mock())
+
+    assert type(observable1) is type(observable2)
+    assert type(observable3) is c.helpers.ObservableSprite
+    assert type(observable1)._observed_attributes == {'alpha', 'health'}
+    observable3.health = 10
+    assert observable3._observe is None
+    assert set(observable1._observe.keys()) == {'alpha', 'health'}
+
+
+def test_it_can_read_and_delete_observed_plain_attributes():
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    observable.after_change('health', handler)
+    with pytest.raises(AttributeError):
+        observable.health
+    observable.health = 10
+    handler.assert_called_once_with(observable, 'health', None, 10)
+    assert observable.health == 10
+    del observable.health
+    assert not hasattr(observable, 'health')
+
+
+def test_it_keeps_observer_storage_compact():
+    observers = c.helpers.Observers()
+    handler = mock.Mock()
+    observers.add(c.helpers.ObservableSprite.AFTER_CHANGE, handler)
+    assert observers.before is observers.triggers
+    assert observers.after == (handler, )
+    with pytest.raises(AttributeError):
+        observers.extra = 1
+
+
+def test_it_can_observe_on_class_level():
+    class Enemy(c.helpers.ObservableSprite):
+        pass
+
+    class Boss(Enemy):
+        pass
+
+    handler = mock.Mock()
+    boss_handler = mock.Mock()
+    Enemy.observe_class(Enemy.AFTER_CHANGE, 'health', handler)
+    Boss.observe_class(Boss.AFTER_CHANGE, 'health', boss_handler)
+
+    enemy = Enemy()
+    boss = Boss()
+    instance_handler = mock.Mock()
+    boss.after_change('health', instance_handler)
+    enemy.health = 10
+    boss.health = 20
+
+    assert enemy._observe is None
+    assert type(enemy) is Enemy
+    assert handler.call_count == 2
+    boss_handler.assert_called_once_with(boss, 'health', None, 20)
+    instance_handler.assert_called_once_with(boss, 'health', None, 20)
+
+
+def test_it_can_declare_class_level_observers():
+    health = TriggerAttr('health')
+    calls = []
+
+    class Enemy(c.ObservableSprite):
+        @c.before_change('health')
+        def validate(self, attribute, old, new):
+            calls.append(('before', self, old, new))
+
+        @c.after_change('health')
+        @c.after_change('alpha')
+        def notify(self, attribute, old, new):
+            calls.append(('after', self, attribute))
+
+        @c.trigger(health <= 0)
+        def die(self):
+            calls.append(('die', self))
+
+    enemy1 = Enemy()
+    enemy2 = Enemy()
+    enemy1.health = 10
+    enemy2.health = 0
+    enemy2.alpha = 100
+
+    assert enemy1._observe is None
+    assert type(enemy1) is Enemy
+    assert calls == [
+        ('before', enemy1, None, 10),
+        ('after', enemy1, 'health'),
+        ('before', enemy2, None, 0),
+        ('after', enemy2, 'health'),
+        ('die', enemy2),
+        ('after', enemy2, 'alpha'),
+    ]
+
+
+@pytest.mark.parametrize('value', [(1.5, 2.5), 'dead', None, 10.0])
+def test_it_can_trigger_on_any_value(value):
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    observable.trigger(TriggerAttr('state') == value, handler)
+    observable.state = 'alive'
+    handler.assert_not_called()
+    observable.state = value
+    handler.assert_called_once()
+
+
+def test_it_shares_checks_between_triggers():
+    health = TriggerAttr('health')
+    assert (health > 10).compile().func is (health > 20).compile().func
+    assert (health > 10).compile().func is not (health > 'a').compile().func
+
+
+def test_it_can_combine_triggers():
+    health = TriggerAttr('health')
+    shield = TriggerAttr('shield')
+    observable = c.helpers.ObservableSprite()
+    observable.health = 10
+    observable.shield = 10
+    handler = mock.Mock()
+    either = mock.Mock()
+    observable.trigger((health <= 0) & (shield <= 0), handler)
+    observable.trigger((health <= 0) | (shield <= 0), either)
+
+    observable.health = 0
+    handler.assert_not_called()
+    either.assert_called_once()
+    observable.shield = 0
+    handler.assert_called_once()
+
+
+def test_it_can_trigger_on_a_range():
+    trigger = TriggerAttr('health').between(0, 10) & (TriggerAttr('alpha') > 0)
+    assert len(trigger.triggers) == 3
+    assert trigger.attributes == ('health', 'alpha')
+    sprite = mock.Mock(health=5, alpha=255)
+    trigger.bake(sprite)
+    assert trigger.check(5)
+    sprite.health = 11
+    assert not trigger.check(11)
+
+
+def test_it_can_fire_a_trigger_on_its_edge():
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    observable.trigger((TriggerAttr('alpha') <= 0).edge(), handler)
+    for alpha in [10, 0, 0, 0, 10, 0]:
+        observable.alpha = alpha
+    assert handler.call_count == 2
+
+
+def test_it_can_fire_a_trigger_once():
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    observable.trigger((TriggerAttr('alpha') <= 0).once(), handler)
+    for alpha in [10, 0, 10, 0]:
+        observable.alpha = alpha
+    handler.assert_called_once()
+
+
+def test_it_can_debounce_a_trigger():
+    now = [0]
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    trigger = (TriggerAttr('health') > 10).debounce(1, clock=lambda: now[0])
+    observable.trigger(trigger, handler)
+    for tick in range(30):
+        now[0] = tick / 10
+        observable.health = 11
+    assert handler.call_count == 3
+
+
+def test_it_keeps_gated_trigger_state_per_instance():
+    alpha = TriggerAttr('alpha')
+    calls = []
+
+    class Ghost(c.ObservableSprite):
+        @c.trigger((alpha <= 0).edge())
+        def vanish(self):
+            calls.append(self)
+
+    ghost1 = Ghost()
+    ghost2 = Ghost()
+    for ghost in [ghost1, ghost2, ghost1, ghost2]:
+        ghost.alpha = 0
+    assert calls == [ghost1, ghost2]
+
+
+def test_it_can_batch_changes():
+    batch = c.helpers.ChangeBatch()
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    alpha_handler = mock.Mock()
+    batch.watch(observable, ['center_x', 'alpha'], handler)
+    batch.watch(observable, ['alpha'], alpha_handler)
+
+    observable.center_x = 10
+    observable.center_x = 20
+    observable.angle = 30
+    handler.assert_not_called()
+
+    batch.flush()
+    handler.assert_called_once_with(observable, {'center_x': (0, 20)})
+    alpha_handler.assert_not_called()
+
+    batch.flush()
+    handler.assert_called_once()
+
+
+def test_it_can_forget_a_batched_sprite():
+    batch = c.helpers.ChangeBatch()
+    observable = c.helpers.ObservableSprite()
+    handler = mock.Mock()
+    batch.watch(observable, ['alpha'], handler)
+    observable.alpha = 10
+    batch.forget(observable)
+    batch.flush()
+    handler.assert_not_called()
+
+    observable.alpha = 20
+    assert batch.pending == {}
+
+
+def test_it_doesnt_keep_batched_sprites_alive():
+    batch = c.helpers.ChangeBatch()
+    observable = c.helpers.ObservableSprite()
+    calls = []
+    batch.watch(observable, ['alpha'],
+                lambda sprite, changes: calls.append(changes))
+    observable.alpha = 10
+    batch.flush()
+    assert calls == [{'alpha': (255, 10)}]
+    del observable
+    gc.collect()
+    assert len(batch.handlers) == 0
+
+
+def test_it_can_evaluate_a_trigger_for_many_sprites():
+    health = TriggerAttr('health')
+    sprites = [mock.Mock(health=h, alpha=255) for h in [10, 0, -5, 20]]
+    handler = mock.Mock()
+    group = c.helpers.TriggerGroup(
+        sprites, (health <= 0) & (TriggerAttr('alpha') > 0), handler)
+    group.evaluate(1 / 60)
+    assert handler.call_args_list == [mock.call(sprites[1]),
+                                      mock.call(sprites[2])]
+
+
+def test_it_can_evaluate_tuple_triggers_for_many_sprites():
+    position = TriggerAttr('position')
+    sprites = [mock.Mock(position=p) for p in [(1., 0.), (2., 0.), (2., 1.)]]
+    equal = mock.Mock()
+    different = mock.Mock()
+    c.helpers.TriggerGroup(sprites, position == (2., 0.), equal).evaluate()
+    c.helpers.TriggerGroup(sprites, position != (2., 0.), different).evaluate()
+    assert equal.call_args_list == [mock.call(sprites[1])]
+    assert different.call_args_list == [mock.call(sprites[0]),
+                                        mock.call(sprites[2])]
+
+    with pytest.raises(ValueError):
+        c.helpers.TriggerGroup(sprites, position > (1., 0.), equal).evaluate()
+
+
+def test_it_can_evaluate_gated_triggers_for_many_sprites():
+    now = [0]
+    health = TriggerAttr('health')
+    sprites = [mock.Mock(health=0), mock.Mock(health=10)]
+    edge = mock.Mock()
+    debounced = mock.Mock()
+    edge_group = c.helpers.TriggerGroup(sprites, (health <= 0).edge(), edge)
+    debounced_group = c.helpers.TriggerGroup(
+        sprites, (health <= 0).debounce(1, clock=lambda: now[0]), debounced)
+
+    for tick in range(3):
+        now[0] = tick * .75
+        sprites[1].health = [0, 10, 0][tick]
+        edge_group.evaluate()
+        debounced_group.evaluate()
+
+    assert edge.call_args_list == [mock.call(sprites[0]),
+                                   mock.call(sprites[1]),
+                                   mock.call(sprites[1])]
+    assert debounced.call_args_list == [mock.call(sprites[0]),
+                                        mock.call(sprites[1]),
+                                        mock.call(sprites[0]),
+                                        mock.call(sprites[1])]
+
+    sprites.append(mock.Mock(health=0))
+    edge_group.evaluate()
+    assert edge.call_count == 6
+
+
+def test_it_can_read_attributes_from_spritelist_buffers():
+    spritelist = arcade.SpriteList()
+    for x in range(3):
+        spritelist.append(arcade.Sprite(center_x=x))
+    assert list(c.helpers.sprite_column(spritelist, 'center_x')) == [0, 1, 2]
+
+    spritelist._vao1 = mock.Mock()
+    spritelist._sprite_pos_data = array.array('f', [5, 6, 7, 8, 9, 10])
+    assert list(c.helpers.sprite_column(spritelist, 'center_y')) == [6, 8, 10]
+
+
+def test_it_compiles_a_trigger_once():
+    trigger = TriggerAttr('health') > 10
+    assert trigger.compile() is trigger.compile()
+
+
 def test_it_can_anchor_sprites():
     anchor = c.helpers.AnchorPoint(50, 50)
     sprite1 = arcade.Sprite()
@@ -81,6 +411,79 @@ def test_it_can_anchor_sprites():
     assert sprite2.position == (450, 450)
 
 
+def test_anchors_notify_coordinate_observers_of_docked_sprites():
+    anchor = c.helpers.AnchorPoint(0, 0)
+    observable = c.helpers.ObservableSprite()
+    x_handler, y_handler = mock.Mock(), mock.Mock()
+    observable.after_change('center_x', x_handler)
+    observable.after_change('center_y', y_handler)
+    anchor.dock(observable)
+
+    anchor.position = (10, 20)
+    x_handler.assert_called_once_with(observable, 'center_x', 0, 10)
+    y_handler.assert_called_once_with(observable, 'center_y', 0, 20)
+
+    anchor.center_x = 15
+    assert x_handler.call_count == 2
+    assert y_handler.call_count == 1
+    assert observable.position == (15, 20)
+
+
+def test_it_can_move_nested_anchors_in_one_pass():
+    class Boat:
+        writes = 0
+
+        def __init__(self):
+            self._position = (0, 0)
+
+        @property
+        def position(self):
+            return self._position
+
+        @position.setter
+        def position(self, value):
+            self.writes += 1
+            self._position = value
+
+    root = c.helpers.AnchorPoint(0, 0)
+    child = c.helpers.AnchorPoint(10, 10)
+    root.dock(child)
+    boat1, boat2 = Boat(), Boat()
+    root.dock(boat1)
+    child.dock(boat2)
+
+    root.position = (5, 10)
+    assert child.position == (15, 20)
+    assert boat1.position == (5, 10)
+    assert boat2.position == (5, 10)
+    assert boat1.writes == boat2.writes == 1
+
+    root.center_x = 0
+    root.move(0, 0)
+    assert boat2.position == (0, 10)
+    assert boat2.writes == 2
+
+
+def test_it_can_rotate_and_scale_nested_anchors():
+    root = c.helpers.AnchorPoint(0, 0)
+    child = c.helpers.AnchorPoint(10, 0)
+    root.dock(child)
+    sprite1 = arcade.Sprite(center_x=0, center_y=10)
+    sprite2 = arcade.Sprite(center_x=20, center_y=0)
+    root.dock(sprite1)
+    child.dock(sprite2)
+
+    root.rotate(90)
+    root.scale = 2
+    assert root.angle == 90
+    assert child.position == pytest.approx((0, 20))
+    assert child.angle == 90
+    assert sprite1.position == pytest.approx((-20, 0))
+    assert sprite2.position == pytest.approx((0, 40))
+    assert sprite2.angle == pytest.approx(90)
+    assert sprite2.scale == pytest.approx(2)
+
+
 def test_it_can_make_anchor_from_sprite():
     sprite1 = arcade.Sprite()
     sprite1.position = (100, 100)
@@ -147,3 +550,192 @@ def test_it_can_set_widget_bounds(get_window):
 
     wdg.bottom = 100
     assert wdg.top == 550
+
+
+@mock.patch("arcade.get_window")
+def test_widgets_resolve_their_viewport_once(get_window):
+    class MyWidget(Widget):
+        def setup(self):
+            pass
+
+    window = HeadlessWindow(1000, 800)
+    get_window.return_value = window
+    wdg = MyWidget(x=200, y=300, width=100, height=150)
+    other = MyWidget(x=200, y=300, width=100, height=150)
+
+    assert wdg.right == 750
+    assert wdg.top == 425
+    assert other.viewport is wdg.viewport
+    assert get_window.call_count == 2
+
+    window.set_size(500, 400)
+    assert wdg.right == 250
+    assert wdg.top == 25
+    assert get_window.call_count == 2
+
+
+@mock.patch("arcade.get_window")
+def test_widgets_can_be_laid_out_in_their_parent(get_window):
+    class Inner(Widget):
+        layout_in_parent = True
+
+        def setup(self):
+            pass
+
+    class Outer(Widget):
+        def setup(self):
+            self.inner = Inner(0, 0, 20, 20)
+
+    get_window.return_value = HeadlessWindow(1000, 800)
+    outer = Outer(x=200, y=300, width=100, height=100)
+    inner = outer.inner
+    assert outer.bounds == (150, 250, 250, 350)
+
+    inner.right = 10
+    inner.top = 0
+    assert inner.position == (230, 340)
+    assert inner.left == 70
+    assert inner.bottom == 80
+
+    inner.container = inner.viewport
+    assert inner.left == 220
+
+
+def test_a_widget_batch_culls_hidden_and_offscreen_widgets():
+    class Inner(Widget):
+        def setup(self):
+            arcade.Sprite()
+
+    class Outer(Widget):
+        def setup(self):
+            arcade.Sprite()
+            self.inner = Inner(0, 0, 20, 20)
+
+    with mock.patch("arcade.get_window"):
+        onscreen = Outer(100, 100, 50, 50)
+        offscreen = Outer(-500, 100, 50, 50)
+        hidden = Outer(300, 100, 50, 50)
+    hidden.hide()
+    batch = c.helpers.WidgetBatch([onscreen, offscreen, hidden],
+                                  viewport=c.helpers.Viewport(1000, 800))
+    offscreen.inner.position = (200, 200)
+
+    assert batch.visible_widgets() == [onscreen, onscreen.inner,
+                                       offscreen.inner]
+    with mock.patch.object(arcade.SpriteList, "draw") as draw:
+        batch.draw(filter='gl.GL_NEAREST')
+        spritelist = batch.spritelist
+        assert len(spritelist) == 3
+        batch.draw()
+        assert batch.spritelist is spritelist
+
+        onscreen.hide()
+        batch.draw()
+    assert len(batch.spritelist) == 1
+    assert spritelist not in onscreen.inner.spritelist[0].sprite_lists
+    draw.assert_any_call(filter='gl.GL_NEAREST')
+
+
+def test_a_widget_batch_picks_up_swapped_sprites():
+    class Panel(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite()
+
+    with mock.patch("arcade.get_window"):
+        panel = Panel(100, 100, 50, 50)
+    batch = c.helpers.WidgetBatch([panel],
+                                  viewport=c.helpers.Viewport(1000, 800))
+    old = panel.sprite
+    new = arcade.Sprite(center_x=100, center_y=100)
+    with mock.patch.object(arcade.SpriteList, "draw"):
+        batch.draw()
+        panel.spritelist.remove(old)
+        panel.spritelist.append(new)
+        batch.draw()
+    assert list(batch.spritelist) == [new]
+
+
+def test_widgets_without_a_size_are_as_large_as_their_content():
+    class Label(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite()
+            self.sprite.width, self.sprite.height = 20, 10
+
+    class Panel(Widget):
+        def setup(self):
+            self.background = arcade.Sprite()
+            self.background.width, self.background.height = 40, 40
+            self.label = Label(30, 0, None, None)
+
+    panel = Panel(100, 100, None, None)
+    assert panel.label.bounds == (120, 95, 140, 105)
+    assert panel.bounds == (80, 80, 140, 120)
+    assert (panel.width, panel.height) == (60, 40)
+    assert panel._bounds is not None
+
+    panel.label.sprite.center_y = 130
+    assert panel._bounds is None and panel.label._bounds is None
+    assert panel.bounds == (80, 80, 140, 135)
+
+    panel.position = (0, 0)
+    assert panel.bounds == (-20, -20, 40, 35)
+    assert panel.collides_with_point((30, 30))
+    assert not panel.collides_with_point((30, -30))
+
+    with mock.patch("arcade.get_window") as get_window:
+        get_window.return_value = HeadlessWindow(1000, 800)
+        panel.left = 0
+        assert panel.bounds == (0, -20, 60, 35)
+        panel.top = 0
+        assert panel.bounds == (0, 745, 60, 800)
+
+
+class Child(Widget):
+    def setup(self):
+        self.sprite = arcade.Sprite()
+        self.sprite.width = self.sprite.height = 10
+
+
+class Parent(Widget):
+    def setup(self):
+        self.sprite = arcade.Sprite()
+        self.sprite.width = self.sprite.height = 10
+        self.child = Child(50, 0, 20, 20)
+
+
+def test_it_invalidates_bounds_of_parents_of_fixed_size_widgets():
+    parent = Parent(0, 0, None, None)
+    assert parent.bounds == (-5, -10, 60, 10)
+
+    parent.child.position = (200, 0)
+    assert parent.bounds == (-5, -10, 210, 10)
+
+
+def test_it_invalidates_bounds_when_an_anchor_moves():
+    class Empty(Widget):
+        def setup(self):
+            pass
+
+    class Holder(Widget):
+        def setup(self):
+            self.empty = Empty(20, 0, 10, 10)
+
+    holder = Holder(0, 0, None, None)
+    assert holder.bounds == (15, -5, 25, 5)
+
+    holder.empty.anchor.move(10, 0)
+    assert holder.bounds == (25, -5, 35, 5)
+    holder.anchor.rotate(90)
+    assert holder._bounds is None
+
+
+def test_anchors_notify_watchers_when_they_move():
+    root = c.helpers.AnchorPoint(0, 0)
+    child = c.helpers.AnchorPoint(10, 0)
+    root.dock(child)
+    watcher = mock.Mock()
+    child.watch(watcher)
+
+    root.position = (10, 10)
+    root.rotate(90)
+    assert watcher.call_count == 2
@@ -0,0 +1,148 @@
+from unittest import mock
+
+import arcade
+import pytest
+
+from arcade_curtains import Column, EdgeLayout, Grid, Row, SceneGraph
+from arcade_curtains.helpers import Widget
+
+
+class Item:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.writes = 0
+        self._position = None
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self.writes += 1
+        self._position = value
+
+
+def test_a_row_stacks_items_from_left_to_right():
+    items = [Item(10, 10), Item(20, 30), Item(10, 10)]
+    row = Row(*items, spacing=5, padding=2, align="start")
+    assert row.measure() == (54, 34)
+
+    row.apply(100, 100)
+    assert [item.position for item in items] == [
+        (80, 90), (100, 100), (120, 90)]
+
+
+def test_a_column_stacks_items_from_top_to_bottom():
+    items = [Item(10, 10), Item(20, 30)]
+    column = Column(*items, spacing=10, align="end")
+    assert column.measure() == (20, 50)
+
+    column.apply()
+    assert [item.position for item in items] == [(5, 20), (0, -10)]
+
+
+def test_a_grid_places_items_in_cells():
+    items = [Item(10, 10) for _ in range(5)]
+    grid = Grid(*items, columns=2, spacing=2)
+    assert grid.measure() == (22, 34)
+
+    grid.apply()
+    assert items[0].position == (-6, 12)
+    assert items[1].position == (6, 12)
+    assert items[4].position == (-6, -12)
+
+
+def test_an_edge_layout_pins_items_to_edges():
+    close, title, body = Item(10, 10), Item(50, 10), Item(20, 20)
+    edges = EdgeLayout(100, 80)
+    edges.add(close, "topright", margin=2)
+    edges.add(title, "top")
+    edges.add(body)
+    edges.apply(50, 40)
+    assert close.position == (93, 73)
+    assert title.position == (50, 75)
+    assert body.position == (50, 40)
+
+    with pytest.raises(ValueError):
+        edges.add(Item(1, 1), "middle")
+
+
+def test_it_only_applies_invalidated_layouts():
+    first, second = Item(10, 10), Item(10, 10)
+    left, right = Column(first), Column(second)
+    row = Row(left, right)
+    row.apply()
+    assert first.writes == second.writes == 1
+
+    row.apply()
+    assert first.writes == second.writes == 1
+
+    second.height = 20
+    right.invalidate(second)
+    assert row.dirty and right.dirty and not left.dirty
+    row.apply()
+    assert first.writes == 1
+    assert second.writes == 2
+    assert row.measure() == (20, 20)
+
+
+def test_it_applies_layouts_that_moved():
+    first, second = Item(10, 10), Item(10, 10)
+    left, right = Column(first), Column(second)
+    row = Row(left, right)
+    row.apply()
+
+    first.width = 20
+    left.invalidate(first)
+    row.apply()
+    assert first.position == (-5, 0)
+    assert second.position == (10, 0)
+    assert second.writes == 2
+
+    row.apply(10, 0)
+    assert second.position == (20, 0)
+    row.apply(20, 0, docked=True)
+    assert second.position == (20, 0)
+
+
+class Toolbar(Widget):
+    def setup(self):
+        self.buttons = [arcade.Sprite() for _ in range(3)]
+        for button in self.buttons:
+            button.width = button.height = 10
+        self.layout = Row(*self.buttons, spacing=5)
+
+
+@mock.patch("arcade.get_window")
+def test_widgets_apply_their_layout(get_window):
+    toolbar = Toolbar(100, 100, 40, 10)
+    assert [button.position for button in toolbar.buttons] == [
+        (85, 100), (100, 100), (115, 100)]
+
+    button = toolbar.buttons[0]
+    toolbar.layout.remove(button)
+    toolbar.relayout()
+    assert [button.position for button in toolbar.buttons[1:]] == [
+        (92.5, 100), (107.5, 100)]
+
+
+@mock.patch("arcade.get_window")
+def test_widgets_in_a_scene_graph_apply_their_layout(get_window):
+    graph = SceneGraph()
+    with graph:
+        toolbar = Toolbar(100, 100, 40, 10)
+    graph.update()
+
+    toolbar.position = (200, 100)
+    toolbar.layout.remove(toolbar.buttons[0])
+    toolbar.relayout()
+    graph.update()
+    assert [button.position for button in toolbar.buttons[1:]] == [
+        (192.5, 100), (207.5, 100)]
+
+    toolbar.position = (300, 100)
+    graph.update()
+    assert [button.position for button in toolbar.buttons[1:]] == [
+        (292.5, 100), (307.5, 100)]
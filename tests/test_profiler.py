@@ -0,0 +1,123 @@
+import time
+from unittest.mock import Mock
+
+import arcade
+import pytest
+
+from arcade_curtains import BaseScene, HeadlessCurtains
+from arcade_curtains.profiler import (FrameProfiler, PHASES,
+                                      SlowHandlerWarning, handler_name)
+
+
+class Scene(BaseScene):
+    def setup(self):
+        pass
+
+
+@pytest.fixture(scope='function')
+def headless():
+    curtains = HeadlessCurtains()
+    curtains.add_scene('scene1', Scene())
+    curtains.set_scene('scene1')
+    yield curtains
+    arcade.set_window(None)
+
+
+def some_handler(*args):
+    pass
+
+
+def test_it_can_name_handlers():
+    assert handler_name(some_handler) == 'some_handler'
+    assert handler_name(FrameProfiler().end_frame) == 'FrameProfiler.end_frame'
+
+
+def test_it_can_record_phases_per_frame(headless):
+    profiler = headless.enable_profiling(window=5)
+    headless.run(10)
+    assert profiler.frame_count == 10
+    for phase in PHASES:
+        assert len(profiler.phases[phase]) == 5
+    assert set(profiler.summary()['update'].keys()) == {'p50', 'p90', 'p99'}
+
+
+def test_it_can_attribute_handler_costs(headless):
+    profiler = headless.enable_profiling()
+    scene = headless.current_scene
+    scene.events.frame(some_handler)
+    arcade.Sprite().animate(position=(100, 100), duration=1)
+    headless.run(3)
+    assert 'some_handler' in profiler.handler_costs
+    assert 'AnimationManager._blip' in profiler.handler_costs
+    assert profiler.last_frame()['animations'] > 0
+    assert profiler.top_handlers(1)[0][1] > 0
+
+
+def test_it_can_profile_scenes_added_later(headless):
+    profiler = headless.enable_profiling()
+    scene = Scene()
+    headless.add_scene('scene2', scene)
+    headless.set_scene('scene2')
+    scene.events.key_down(arcade.key.ESCAPE, some_handler)
+    headless.tap(arcade.key.ESCAPE)
+    assert 'some_handler' in profiler.handler_costs
+
+
+def test_it_records_key_handlers_as_events(headless):
+    profiler = headless.enable_profiling()
+    scene = headless.current_scene
+    scene.events.key_down(arcade.key.ESCAPE, lambda: time.sleep(.01))
+    scene.events.key_up(arcade.key.ESCAPE, lambda: time.sleep(.01))
+    headless.tap(arcade.key.ESCAPE)
+    headless.run(1)
+    assert profiler.last_frame()['events'] >= .02
+
+
+def test_it_can_disable_profiling(headless):
+    headless.enable_profiling()
+    headless.disable_profiling()
+    headless.current_scene.events.frame(Mock())
+    headless.run(2)
+    assert headless.profiler is None
+    assert headless.current_scene.events.event_group.profiler is None
+
+
+def test_it_keeps_profilers_scenes_enabled_themselves():
+    class ProfiledScene(BaseScene):
+        def setup(self):
+            self.profiler = self.events.enable_profiling(budget=0)
+
+    headless = HeadlessCurtains()
+    scene = ProfiledScene()
+    headless.add_scene('scene1', scene)
+    headless.set_scene('scene1')
+    assert scene.events.profiler is scene.profiler
+
+    def slow_handler(*args):
+        time.sleep(.001)
+
+    scene.events.frame(slow_handler)
+    with pytest.warns(SlowHandlerWarning):
+        headless.run(2)
+    assert scene.profiler.frame_count == 2
+    assert scene.profiler.slow_handlers
+
+    curtains_profiler = headless.enable_profiling()
+    assert scene.events.profiler is curtains_profiler
+    headless.run(1)
+    assert curtains_profiler.frame_count == 1
+    assert scene.profiler.frame_count == 2
+    arcade.set_window(None)
+
+
+def test_it_can_calculate_percentiles():
+    profiler = FrameProfiler()
+    assert profiler.percentile('draw', 50) == 0
+    for duration in range(1, 101):
+        with profiler.phase('draw'):
+            pass
+        profiler._current['draw'] = duration
+        profiler.end_frame()
+    assert profiler.percentile('draw', 50) == 50.5
+    profiler.reset()
+    assert profiler.frame_count == 0
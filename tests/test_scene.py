@@ -1,9 +1,13 @@
+from unittest import mock
 from unittest.mock import Mock
 
+import arcade
 from arcade.application import MOUSE_BUTTON_LEFT
+from arcade.key import ESCAPE
 import pytest
 
-from arcade_curtains import BaseScene, Curtains
+from arcade_curtains import (BaseScene, Curtains, HeadlessCurtains,
+                             ObservableSprite, Widget, WidgetBatch)
 
 
 class Scene(BaseScene):
@@ -29,6 +33,15 @@ def curtains():
     return _curtains()
 
 
+@pytest.fixture(scope='function')
+def headless():
+    curtains = HeadlessCurtains(width=1000, height=800)
+    curtains.add_scene('scene1', Scene())
+    curtains.set_scene('scene1')
+    yield curtains
+    arcade.set_window(None)
+
+
 def test_it_triggers_the_right_scene_event(sprite, curtains):
     scene1, scene2 = curtains.scenes.values()
     scene1.events.click(sprite, sprite.handler)
@@ -120,6 +133,182 @@ def test_it_can_send_draw_kwargs():
     curtains = _curtains(draw_kwargs={'filter': 'gl.GL_NEAREST'})
     scene1 = curtains.scenes['scene1']
     spritelist = Mock()
-    scene1._sprite_lists.append(spritelist)
+    scene1.layers.add(spritelist)
     scene1.draw()
     spritelist.draw.assert_called_with(filter='gl.GL_NEAREST')
+
+
+def test_it_draws_widget_batches():
+    class WidgetScene(BaseScene):
+        def setup(self):
+            self.sprites = arcade.SpriteList()
+            self.widgets = WidgetBatch()
+
+    scene = WidgetScene()
+    assert scene._sprite_lists == (scene.sprites, scene.widgets)
+
+
+def test_it_tracks_spritelists_assigned_after_setup():
+    class ListScene(BaseScene):
+        def setup(self):
+            self.background = arcade.SpriteList()
+            self.sprites = arcade.SpriteList()
+
+    scene = ListScene()
+    background = scene.background
+    scene.effects = arcade.SpriteList()
+    assert scene._sprite_lists == (background, scene.sprites, scene.effects)
+
+    scene.background = arcade.SpriteList()
+    assert scene._sprite_lists == (
+        scene.background, scene.sprites, scene.effects)
+    assert background not in scene.layers
+
+    scene.copy = scene.sprites
+    del scene.sprites
+    assert scene._sprite_lists == (scene.background, scene.copy, scene.effects)
+    scene.copy = None
+    assert scene._sprite_lists == (scene.background, scene.effects)
+
+
+def test_it_tracks_spritelists_assigned_before_init():
+    class EarlyScene(BaseScene):
+        def __init__(self):
+            self.background = arcade.SpriteList()
+            super().__init__()
+
+        def setup(self):
+            self.sprites = arcade.SpriteList()
+
+    scene = EarlyScene()
+    assert scene._sprite_lists == (scene.background, scene.sprites)
+    with pytest.raises(AttributeError):
+        scene._sprite_lists.append(arcade.SpriteList())
+
+
+def test_it_orders_and_hides_render_layers():
+    scene = Scene()
+    first, second, hud = (arcade.SpriteList() for _ in range(3))
+    scene.layers.add(hud, z=10)
+    scene.layers.add(first)
+    scene.layers.add(second)
+    assert scene._sprite_lists == (first, second, hud)
+
+    scene.layers.set_z(first, 0)
+    assert scene._sprite_lists == (second, first, hud)
+    scene.layers.set_z(hud, -1)
+    assert list(scene.layers) == [hud, second, first]
+
+    scene.layers.hide(second)
+    assert scene._sprite_lists == (hud, first)
+    assert not scene.layers.is_visible(second)
+    scene.layers.show(second)
+    assert scene._sprite_lists == (hud, second, first)
+
+    scene.layers.remove(hud)
+    assert scene._sprite_lists == (second, first)
+    with pytest.raises(ValueError):
+        scene.layers.add(first)
+
+
+@mock.patch("arcade.get_window")
+def test_it_draws_widget_layers(get_window):
+    class Panel(Widget):
+        def setup(self):
+            self.sprite = arcade.Sprite()
+
+    scene = Scene()
+    panel = Panel(100, 100, 50, 50)
+    scene.layers.add(panel, z=1)
+    batch, = scene._sprite_lists
+    assert isinstance(batch, WidgetBatch)
+    assert batch.widgets == [panel]
+    scene.layers.hide(panel)
+    assert scene._sprite_lists == ()
+
+
+def test_it_can_scale_scene_time(sprite, curtains):
+    scene1 = curtains.scenes['scene1']
+    scene1.events.frame(sprite.handler)
+    curtains.time_scale = .5
+    scene1.time_scale = .5
+    curtains.update(1)
+    sprite.handler.assert_called_once_with(.25)
+
+
+def test_it_can_pause_and_step_a_scene(sprite, curtains):
+    scene1 = curtains.scenes['scene1']
+    scene1.events.frame(sprite.handler)
+    scene1.pause()
+    curtains.update(1)
+    sprite.handler.assert_not_called()
+    scene1.step(.5)
+    sprite.handler.assert_called_once_with(.5)
+    scene1.resume()
+    curtains.update(1)
+    assert sprite.handler.call_count == 2
+
+
+def test_it_can_run_headless_frames(sprite, headless):
+    scene1 = headless.scenes['scene1']
+    scene1.events.frame(sprite.frame_handler)
+    scene1.events.after_draw(sprite.draw_handler)
+    assert headless.run(10, delta_time=.1) == 10
+    assert sprite.frame_handler.call_count == 10
+    assert sprite.draw_handler.call_count == 10
+    assert headless.frame_count == 10
+    assert round(headless.elapsed_time, 5) == 1
+
+
+def test_it_can_stop_a_headless_run_early(headless):
+    assert headless.run(10, until=lambda: headless.frame_count == 3) == 3
+
+
+def test_it_can_animate_headless():
+    headless = HeadlessCurtains()
+    headless.add_scene('scene1', Scene())
+    headless.set_scene('scene1')
+    sprite = arcade.Sprite()
+    sprite.animate(position=(100, 100), duration=1)
+    headless.run(4, delta_time=.125)
+    assert sprite.position == (50, 50)
+    arcade.set_window(None)
+
+
+def test_it_can_send_synthetic_input_headless(sprite, headless):
+    scene1 = headless.scenes['scene1']
+    scene1.events.click(sprite, sprite.click_handler)
+    scene1.events.hover(sprite, sprite.hover_handler)
+    scene1.events.drag(sprite, sprite.drag_handler)
+    scene1.events.key_down(ESCAPE, sprite.key_handler)
+
+    headless.click(50, 50)
+    sprite.click_handler.assert_called_once()
+    sprite.hover_handler.assert_called_once()
+
+    headless.press(50, 50)
+    headless.drag(60, 55)
+    sprite.drag_handler.assert_called_once_with(sprite, 60, 55, 10, 5)
+
+    headless.tap(ESCAPE)
+    sprite.key_handler.assert_called_once()
+
+
+def test_it_cant_bind_a_headless_curtains(headless):
+    with pytest.raises(Exception):
+        headless.bind(Mock())
+
+
+def test_it_can_deliver_batched_changes_before_drawing(headless):
+    scene1 = headless.scenes['scene1']
+    sprite = ObservableSprite()
+    handler = Mock()
+    scene1.changes.watch(sprite, ['position', 'angle'], handler)
+    sprite.animate(position=(100, 100), angle=90, duration=1)
+    calls = []
+    scene1.events.after_draw(lambda: calls.append(handler.call_count))
+
+    headless.run(2, delta_time=.25)
+    assert calls == [1, 2]
+    sprite, changes = handler.call_args[0]
+    assert changes == {'position': ((25, 25), (50, 50)), 'angle': (22.5, 45)}
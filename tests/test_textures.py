@@ -0,0 +1,64 @@
+from unittest import mock
+
+import arcade
+
+from arcade_curtains.textures import (DEFAULT_FONT, TEXT_TEXTURES,
+                                      TextureCache, soft_circle_texture,
+                                      soft_square_texture, text_texture)
+
+
+def test_a_texture_cache_only_generates_on_a_miss():
+    cache = TextureCache(maxsize=2)
+    factory = mock.Mock(side_effect=lambda: object())
+    first = cache.get("a", factory)
+    assert cache.get("a", factory) is first
+    assert factory.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_a_texture_cache_evicts_the_least_recently_used():
+    cache = TextureCache(maxsize=2)
+    cache.get("a", object)
+    cache.get("b", object)
+    cache.get("a", object)
+    cache.get("c", object)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_a_texture_cache_evicts_to_stay_under_its_memory_cap():
+    cache = TextureCache(maxbytes=2 * 10 * 10 * 4)
+    for color in (arcade.color.RED, arcade.color.GREEN, arcade.color.BLUE):
+        cache.get(color, lambda: arcade.make_soft_square_texture(10, color))
+    assert len(cache) == 2
+    assert cache.nbytes == 800
+    assert arcade.color.RED not in cache
+
+    cache.get("large", lambda: arcade.make_soft_square_texture(20, (0, 0, 0)))
+    assert len(cache) == 1
+    assert cache.nbytes == 1600
+
+
+def test_it_shares_generated_textures():
+    circle = soft_circle_texture(10, [255, 0, 0])
+    assert soft_circle_texture(10, (255, 0, 0)) is circle
+    assert soft_circle_texture(12, (255, 0, 0)) is not circle
+    assert soft_square_texture(10, (255, 0, 0)) is not circle
+    assert circle.name == arcade.make_soft_circle_texture(
+        10, (255, 0, 0)).name
+
+
+def test_it_shares_text_textures():
+    texture = text_texture("Score: 10", font_size=14, color=arcade.color.RED)
+    assert isinstance(texture, arcade.Texture)
+    assert texture.width > 0
+    assert text_texture("Score: 10", font_size=14,
+                        color=arcade.color.RED) is texture
+    assert text_texture("Score: 10", font_size=14,
+                        color=arcade.color.BLUE) is not texture
+    assert (DEFAULT_FONT, 14, "Score: 10",
+            tuple(arcade.color.RED)) in TEXT_TEXTURES
@@ -0,0 +1,143 @@
+from unittest import mock
+
+import arcade
+import pytest
+
+from arcade_curtains import (BaseScene, HeadlessCurtains, SceneGraph,
+                             TextSprite, VirtualList)
+from arcade_curtains import textures
+from arcade_curtains.widgets import OFFSCREEN
+
+
+class Scene(BaseScene):
+    def setup(self):
+        pass
+
+
+@pytest.fixture(scope='function')
+def headless():
+    curtains = HeadlessCurtains()
+    curtains.add_scene('scene1', Scene())
+    curtains.set_scene('scene1')
+    yield curtains
+    arcade.set_window(None)
+
+
+def make_row():
+    return arcade.SpriteSolidColor(100, 20, arcade.color.WHITE)
+
+
+def test_a_virtual_list_only_binds_visible_rows():
+    bind_row = mock.Mock()
+    items = list(range(10000))
+    virtual = VirtualList(200, 300, 100, 100, items, 20, make_row, bind_row)
+    assert virtual.pool_size == 6
+    assert len(virtual.spritelist) == 6
+    assert bind_row.call_count == 6
+    assert virtual.rows[0].position == (200, 340)
+
+    bind_row.reset_mock()
+    virtual.scroll(20)
+    bind_row.assert_called_once_with(virtual.rows[0], 6, 6)
+    assert virtual.rows[1].position == (200, 340)
+    assert virtual.rows[0].position == OFFSCREEN
+    assert virtual.rows[0].alpha == 0
+
+    virtual.scroll_to_index(9999)
+    assert virtual.scroll_offset == virtual.max_scroll == 199900
+    assert virtual.item_for(virtual.rows[9999 % 6]) == (9999, 9999)
+    assert virtual.rows[4].alpha == 0
+
+
+def test_a_virtual_list_can_show_a_grid():
+    virtual = VirtualList(0, 0, 100, 40, list(range(5)), 20, make_row,
+                          mock.Mock(), columns=2)
+    assert virtual.pool_size == 6
+    assert virtual.rows[0].position == (-25, 10)
+    assert virtual.rows[3].position == (25, -10)
+    assert virtual.rows[4].position == OFFSCREEN
+    assert virtual.rows[5].position == OFFSCREEN
+    assert virtual.rows[5].alpha == 0
+
+    virtual.set_items([1])
+    assert virtual.bound == [0, None, None, None, None, None]
+
+
+def test_a_virtual_list_hides_rows_that_dont_fit():
+    virtual = VirtualList(0, 0, 100, 100, list(range(20)), 20, make_row,
+                          mock.Mock())
+    assert [row.alpha for row in virtual.rows] == [255] * 5 + [0]
+
+    virtual.scroll(5)
+    assert virtual.rows[0].alpha == 0
+    assert [row.alpha for row in virtual.rows[1:5]] == [255] * 4
+    assert virtual.rows[5].alpha == 0
+    virtual.scroll(15)
+    assert virtual.rows[0].alpha == 0
+    assert [row.alpha for row in virtual.rows[1:]] == [255] * 5
+
+
+def test_a_virtual_list_can_be_part_of_a_scene_graph():
+    graph = SceneGraph()
+    with graph:
+        virtual = VirtualList(100, 100, 100, 100, list(range(20)), 20,
+                              make_row, mock.Mock())
+    graph.update()
+    assert virtual.rows[1].position == (100, 120)
+
+    virtual.position = (300, 100)
+    virtual.scroll(5)
+    graph.update()
+    assert virtual.rows[1].position == (300, 125)
+
+    virtual.position = (300, 0)
+    graph.update()
+    assert virtual.rows[1].position == (300, 25)
+
+
+def test_a_virtual_list_resolves_events_to_items(headless):
+    events = headless.current_scene.events
+    on_click = mock.Mock()
+    virtual = VirtualList(400, 300, 100, 100, list("abcdefgh"), 20, make_row,
+                          mock.Mock(), events=events, on_click=on_click)
+    assert len(events.event_group.all_sprites) == 6
+
+    headless.click(400, 345)
+    on_click.assert_called_once_with("a", 0)
+    virtual.scroll(40)
+    headless.click(400, 345)
+    on_click.assert_called_with("c", 2)
+    virtual.scroll(10)
+    headless.click(400, 345)
+    assert on_click.call_count == 2
+
+
+def test_a_short_virtual_list_dispatches_every_click(headless):
+    events = headless.current_scene.events
+    on_click = mock.Mock()
+    VirtualList(400, 300, 100, 100, list("abc"), 20, make_row, mock.Mock(),
+                events=events, on_click=on_click)
+
+    for _ in range(30):
+        headless.click(400, 305)
+    assert on_click.call_count == 30
+    on_click.assert_called_with("c", 2)
+
+
+def test_a_text_sprite_reuses_rendered_text():
+    label = TextSprite("10", font_size=20)
+    ten = label.texture
+    assert label.width == ten.width
+
+    with mock.patch("arcade_curtains.textures.render_text",
+                    wraps=textures.render_text) as render_text:
+        label.text = "10"
+        label.text = "11"
+        label.text = "10"
+        label.text = "11"
+    assert render_text.call_count == 1
+    assert label.texture is not ten
+    label.text = "10"
+    assert label.texture is ten
+    left, bottom = label.get_adjusted_hit_box()[0]
+    assert left == -ten.width / 2